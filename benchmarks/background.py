@@ -0,0 +1,24 @@
+from __future__ import annotations
+from benchmarks.data import make_pupils
+from datacls import DiplomaParametrs, DiplomaTitleLayoutParametrs
+from diploma import DiplomaLayout
+from time import perf_counter
+import sys
+
+def measure(count: int, diploma_title_image: bool, processes: int) -> tuple[float, int, int]:
+    start = perf_counter()
+    pdf = DiplomaLayout(DiplomaParametrs(), DiplomaTitleLayoutParametrs(diploma_title_image=diploma_title_image))
+    pdf.generate_title_lists(make_pupils(count), processes)
+    data = bytes(pdf.pdf.output())
+    elapsed = perf_counter()-start
+    return elapsed, len(data), data.count(b"/Width 4724")
+
+def main(count: int = 5000, processes: int = 0) -> None:
+    for diploma_title_image in (False, True):
+        elapsed, size, backgrounds = measure(count, diploma_title_image, processes or None)
+        print(f"image={diploma_title_image!s:>5}: {count} pages, {elapsed:.2f} s, {size/1024/1024:.1f} MiB, {backgrounds} background XObject(s)")
+        if diploma_title_image and backgrounds != 1:
+            sys.exit(f"expected one shared background image, found {backgrounds}")
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
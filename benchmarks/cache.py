@@ -0,0 +1,38 @@
+from __future__ import annotations
+from benchmarks.data import make_workbook
+from file_parsing import open_parser
+from storage import ParsedCache
+from os import close, path, remove
+from shutil import rmtree
+from tempfile import mkdtemp, mkstemp
+from time import perf_counter
+import sys
+
+def main(count: int = 10000) -> None:
+    fd, file = mkstemp(suffix=".xlsx")
+    close(fd)
+    directory = mkdtemp()
+    try:
+        make_workbook(file, count)
+        start = perf_counter()
+        parser = open_parser(file)
+        table = parser.parse()
+        parser.close()
+        print(f"{'parse':>18}: {count} rows, {perf_counter()-start:.3f} s")
+
+        cache = ParsedCache(directory)
+        start = perf_counter()
+        cache.parse(file)
+        print(f"cold (parse+store): {perf_counter()-start:.3f} s, {path.getsize(cache.get_path(cache.get_key(file)))/1024:.0f} KiB entry, {path.getsize(file)/1024:.0f} KiB workbook")
+
+        start = perf_counter()
+        cached = cache.parse(file)
+        print(f"{'warm hit':>18}: {perf_counter()-start:.3f} s")
+        if (cached.pupils, cached.subjects, cached.ratings.values) != (table.pupils, table.subjects, table.ratings.values):
+            sys.exit("cached table differs from the parsed one")
+    finally:
+        remove(file)
+        rmtree(directory)
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from datacls import PupilInformation
+from datetime import date
+from os import path, makedirs
+import csv
+import json
+import random
+
+from typing import TYPE_CHECKING, Any
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+HEADER = ("Фамилия", "Имя", "Отчество", "День рождения", "Месяц рождения", "Год рождения", "Номер аттестата")
+SECOND_NAMES = ("Иванов", "Петров", "Сидоров", "Смирнов", "Кузнецов", "Попов", "Васильев", "Соколов")
+NAMES = ("Александр", "Виктор", "Михаил", "Иван", "Дмитрий", "Сергей", "Андрей", "Николай")
+THIRD_NAMES = ("Александрович", "Викторович", "Михайлович", "Иванович", "Дмитриевич", "Сергеевич")
+SUBJECTS = (
+    "История", "Физика", "Химия", "Алгебра", "Математика", "Русский язык", "Геометрия", "Литература",
+    "Обществознание", "Биология", "География", "Иностранный язык (английский)", "Информатика и ИКТ",
+    "ОБЖ", "Технология", "Музыка", "Изобразительное искусство", "Астрономия", "Экология", "Экономика",
+    "Черчение", "Краеведение", "Философия", "Риторика", "Естествознание",
+)
+
+def make_pupils(count: int, seed: int = 0) -> list[PupilInformation]:
+    rnd = random.Random(seed)
+    return [
+        PupilInformation(
+            rnd.choice(SECOND_NAMES),
+            rnd.choice(NAMES),
+            rnd.choice(THIRD_NAMES),
+            date(rnd.randint(2004, 2008), rnd.randint(1, 12), rnd.randint(1, 28)),
+            f"037{i:011}",
+        )
+        for i in range(count)
+    ]
+
+def iter_rows(count: int, subjects: int = len(SUBJECTS), seed: int = 0) -> Iterator[list[Any]]:
+    rnd = random.Random(seed)
+    yield list(HEADER+SUBJECTS[:subjects])
+    for pupil in make_pupils(count, seed):
+        b = pupil.birthday
+        ratings = [rnd.choice((3, 4, 5, 5, None)) for _ in range(subjects)]
+        yield [pupil.second_name, pupil.name, pupil.third_name, b.day, b.month, b.year, pupil.diploma_id, *ratings]
+
+def make_workbook(file: str, count: int, subjects: int = len(SUBJECTS), seed: int = 0) -> None:
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for row in iter_rows(count, subjects, seed):
+        ws.append(row)
+    wb.save(file)
+
+def make_csv(file: str, count: int, subjects: int = len(SUBJECTS), seed: int = 0, delimiter: str = ";") -> None:
+    with open(file, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        for row in iter_rows(count, subjects, seed):
+            writer.writerow(row)
+
+def make_jsonl(file: str, count: int, subjects: int = len(SUBJECTS), seed: int = 0) -> None:
+    with open(file, "w", encoding="utf-8") as f:
+        for row in iter_rows(count, subjects, seed):
+            f.write(json.dumps(row, ensure_ascii=False)+"\n")
+
+def get_workbook(directory: str, count: int, subjects: int = len(SUBJECTS), seed: int = 0) -> str:
+    file = path.join(directory, f"pupils_{count}_{subjects}_{seed}.xlsx")
+    if not path.exists(file):
+        makedirs(directory, exist_ok=True)
+        make_workbook(file, count, subjects, seed)
+    return file
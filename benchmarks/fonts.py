@@ -0,0 +1,20 @@
+from __future__ import annotations
+from datacls import DiplomaParametrs, DiplomaTitleLayoutParametrs
+from diploma import DiplomaLayout, FontCache
+from time import perf_counter
+import sys
+
+def measure(count: int) -> float:
+    start = perf_counter()
+    for _ in range(count):
+        DiplomaLayout(DiplomaParametrs(), DiplomaTitleLayoutParametrs())
+    return (perf_counter()-start)/count
+
+def main(count: int = 100) -> None:
+    FontCache.fonts.clear()
+    FontCache.files.clear()
+    print(f"  first layout: {measure(1)*1000:.2f} ms")
+    print(f"cached layouts: {measure(count)*1000:.2f} ms per layout ({count} layouts)")
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from benchmarks.data import make_csv, make_jsonl, make_workbook
+from file_parsing import ExcelParser, open_parser
+from os import close, remove
+from tempfile import mkstemp
+from time import perf_counter
+import sys
+
+def separate_scans(file: str) -> None:
+    parser = ExcelParser(file)
+    parser.get_subjects()
+    parser.get_pupils_info()
+    parser.get_pupils_full_info()
+    parser.close()
+
+def single_pass(file: str) -> None:
+    parser = open_parser(file)
+    parser.parse()
+    parser.close()
+
+def main(count: int = 10000) -> None:
+    files = []
+    try:
+        for suffix, make in ((".xlsx", make_workbook), (".csv", make_csv), (".jsonl", make_jsonl)):
+            fd, file = mkstemp(suffix=suffix)
+            close(fd)
+            files.append(file)
+            make(file, count)
+
+        cases = [("separate scans", separate_scans, files[0])]
+        cases += [(f"single pass {file.rsplit('.', 1)[1]}", single_pass, file) for file in files]
+        for name, f, file in cases:
+            start = perf_counter()
+            f(file)
+            print(f"{name:>18}: {count} rows, {perf_counter()-start:.2f} s")
+    finally:
+        for file in files:
+            remove(file)
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
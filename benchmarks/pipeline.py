@@ -0,0 +1,114 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+from benchmarks.data import SUBJECTS, get_workbook
+from datacls import DiplomaParametrs, DiplomaTitleLayoutParametrs
+from diploma import DiplomaLayout, make_qrcode_png
+from file_parsing import ExcelParser
+from datetime import datetime, timezone
+from importlib.metadata import version
+from os import close, path, remove
+from subprocess import CalledProcessError, run
+from tempfile import mkstemp
+from time import perf_counter
+import json
+import platform
+import sys
+
+from typing import Any
+
+STAGES = ("parse", "qrcode", "layout", "save")
+
+def measure(file: str) -> dict[str, Any]:
+    start = perf_counter()
+    parser = ExcelParser(file)
+    table = parser.parse()
+    parser.close()
+    parse = perf_counter()-start
+
+    pdf = DiplomaLayout(DiplomaParametrs(), DiplomaTitleLayoutParametrs())
+    start = perf_counter()
+    qrcodes = [make_qrcode_png(pdf.get_qrcode_data(pupil), pdf.qrcode_border) for pupil in table.pupils]
+    qrcode = perf_counter()-start
+
+    start = perf_counter()
+    for pupil, png in zip(table.pupils, qrcodes):
+        pdf.generate_title_list(pupil, png)
+    layout = perf_counter()-start
+
+    fd, out = mkstemp(suffix=".pdf")
+    close(fd)
+    try:
+        start = perf_counter()
+        pdf.save_file(out)
+        save = perf_counter()-start
+        size = path.getsize(out)
+    finally:
+        remove(out)
+
+    count = len(table.pupils)
+    return {
+        "pupils": count,
+        "subjects": len(table.subjects),
+        "parse": parse,
+        "qrcode": qrcode,
+        "layout": layout,
+        "save": save,
+        "layout_per_page": layout/count if count else 0.0,
+        "pdf_bytes": size,
+    }
+
+def get_commit() -> str | None:
+    try:
+        result = run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+def get_environment() -> dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "packages": {name: version(name) for name in ("fpdf2", "openpyxl", "segno")},
+    }
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any]) -> None:
+    previous = {r["pupils"]: r for r in baseline["results"]}
+    for r in results:
+        old = previous.get(r["pupils"])
+        if old is None:
+            continue
+        changes = ", ".join(f"{stage} {(r[stage]/old[stage]-1)*100:+.0f}%" for stage in STAGES if old[stage])
+        print(f"{r['pupils']:>7} vs {baseline['environment'].get('commit') or 'baseline'}: {changes}", file=sys.stderr)
+
+def get_argument_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="python -m benchmarks.pipeline", description="Замер времени чтения Excel, вёрстки, QR кодов и сохранения PDF.")
+    parser.add_argument("sizes", type=int, nargs="*", default=[100, 1000, 10000], help="число выпускников в сгенерированных файлах (по умолчанию 100 1000 10000)")
+    parser.add_argument("--subjects", type=int, default=len(SUBJECTS), help=f"число предметов в файле (по умолчанию {len(SUBJECTS)})")
+    parser.add_argument("--data", default="cache/benchmarks", help="папка для сгенерированных файлов Excel (по умолчанию cache/benchmarks)")
+    parser.add_argument("--out", default="-", help="файл для результатов в JSON, - для вывода в stdout")
+    parser.add_argument("--baseline", default=None, help="результаты прошлого замера в JSON для сравнения")
+    return parser
+
+def main(argv: list[str] | None = None) -> None:
+    args = get_argument_parser().parse_args(argv)
+    results = []
+    for count in args.sizes:
+        result = measure(get_workbook(args.data, count, args.subjects))
+        results.append(result)
+        print(" ".join(f"{stage} {result[stage]:.2f} s" for stage in STAGES), f"({count} pupils)", file=sys.stderr)
+
+    report = json.dumps({"environment": get_environment(), "results": results}, ensure_ascii=False, indent=2)
+    if args.out == "-":
+        print(report)
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(report+"\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+if __name__ == "__main__":
+    main()
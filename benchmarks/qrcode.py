@@ -0,0 +1,35 @@
+from __future__ import annotations
+from benchmarks.data import make_pupils
+from datacls import DiplomaParametrs, DiplomaTitleLayoutParametrs
+from diploma import DiplomaLayout
+from os import close, path, remove
+from tempfile import mkstemp
+from time import perf_counter
+import sys
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from datacls import PupilInformation
+
+def measure(pupils: list[PupilInformation], vector_qrcode: bool) -> tuple[float, int]:
+    fd, file = mkstemp(suffix=".pdf")
+    close(fd)
+    try:
+        start = perf_counter()
+        pdf = DiplomaLayout(DiplomaParametrs(), DiplomaTitleLayoutParametrs(), vector_qrcode=vector_qrcode)
+        for pupil in pupils:
+            pdf.generate_title_list(pupil)
+        pdf.save_file(file)
+        elapsed = perf_counter()-start
+        return elapsed, path.getsize(file)
+    finally:
+        remove(file)
+
+def main(count: int = 1000) -> None:
+    pupils = make_pupils(count)
+    for name, vector_qrcode in (("png", False), ("vector", True)):
+        elapsed, size = measure(pupils, vector_qrcode)
+        print(f"{name:>6}: {count} pupils, {elapsed:.2f} s, {size/1024:.0f} KiB")
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
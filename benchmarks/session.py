@@ -0,0 +1,47 @@
+from __future__ import annotations
+from benchmarks.data import SUBJECTS, make_pupils
+from datacls import PupilsTable, Ratings
+from storage import SessionFile
+from os import close, path, remove
+from tempfile import mkstemp
+from time import perf_counter
+import random
+import sys
+
+def make_table(count: int, seed: int = 0) -> PupilsTable:
+    rnd = random.Random(seed)
+    ratings = Ratings(SUBJECTS)
+    for _ in range(count):
+        ratings.append(rnd.choice((3, 4, 5, 5, None)) for _ in SUBJECTS)
+    return PupilsTable(make_pupils(count, seed), ratings) # type: ignore
+
+def main(count: int = 100000, changed: int = 10) -> None:
+    table = make_table(count)
+    fd, file = mkstemp(suffix=".bin")
+    close(fd)
+    try:
+        session = SessionFile(file)
+        start = perf_counter()
+        session.save(table)
+        print(f"  full save: {count} pupils, {perf_counter()-start:.3f} s, {path.getsize(file)/1024:.0f} KiB")
+
+        start = perf_counter()
+        table = SessionFile(file).load()
+        print(f"     reopen: {perf_counter()-start:.3f} s")
+
+        rows = random.Random(1).sample(range(count), changed)
+        for i, row in enumerate(rows):
+            table.pupils[row].second_name = f"Изменённая{i}" # type: ignore
+            table.ratings.set(row, SUBJECTS[0], 2) # type: ignore
+        start = perf_counter()
+        session.save_rows(table, rows) # type: ignore
+        print(f"   autosave: {changed} rows, {(perf_counter()-start)*1000:.2f} ms")
+
+        reopened = SessionFile(file).load()
+        if (reopened.pupils, reopened.ratings.values) != (table.pupils, table.ratings.values): # type: ignore
+            sys.exit("reopened session differs from the edited table")
+    finally:
+        remove(file)
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
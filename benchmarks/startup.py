@@ -0,0 +1,61 @@
+from __future__ import annotations
+from os import close, path, remove
+from statistics import median
+from subprocess import run
+from tempfile import mkstemp
+from time import monotonic
+import json
+import sys
+
+def child(eager: bool) -> None:
+    from PySide6.QtWidgets import QApplication
+    from datacls import PupilsTable, Ratings
+    from main import MainWindow
+
+    app = QApplication(sys.argv[:1])
+    construct = monotonic()
+    window = MainWindow()
+    if eager:
+        window.build_title_layout()
+    window.show()
+    app.processEvents()
+    first_window = monotonic()
+
+    from benchmarks.data import make_pupils
+
+    fd, file = mkstemp(suffix=".pdf")
+    close(fd)
+    try:
+        window.pupils_model.set_table(PupilsTable(make_pupils(1), Ratings(tuple())))
+        window.get_output_file = lambda: file # type: ignore
+        window.generate_diploma()
+        first_pdf = monotonic()
+    finally:
+        remove(file)
+    print(json.dumps({"window": first_window, "pdf": first_pdf, "construct": construct}))
+
+def measure(eager: bool) -> dict[str, float]:
+    start = monotonic()
+    result = run([sys.executable, "-m", "benchmarks.startup", "--eager" if eager else "--deferred"], capture_output=True, text=True, check=True)
+    times = json.loads(result.stdout.splitlines()[-1])
+    return {"window": times["window"]-start, "pdf": times["pdf"]-start, "construct": times["window"]-times["construct"]}
+
+def main(count: int = 5) -> None:
+    settings_existed = path.exists("settings.ini")
+    try:
+        for mode, eager in (("deferred", False), ("eager", True)):
+            results = [measure(eager) for _ in range(count)]
+            for name in ("window", "pdf"):
+                times = [r[name] for r in results]
+                print(f"{mode:>8} first {name:>6}: median {median(times):.2f} s, min {min(times):.2f} s, max {max(times):.2f} s ({count} runs)")
+            times = [r["construct"]*1000 for r in results]
+            print(f"{mode:>8} window built and shown: median {median(times):.1f} ms, min {min(times):.1f} ms")
+    finally:
+        if not settings_existed and path.exists("settings.ini"):
+            remove("settings.ini")
+
+if __name__ == "__main__":
+    if sys.argv[1:2] in (["--eager"], ["--deferred"]):
+        child(sys.argv[1] == "--eager")
+    else:
+        main(*map(int, sys.argv[1:]))
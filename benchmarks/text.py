@@ -0,0 +1,32 @@
+from __future__ import annotations
+from benchmarks.data import make_pupils
+from datacls import DiplomaParametrs, DiplomaTitleLayoutParametrs
+from diploma import DiplomaLayout, TextCache
+from time import perf_counter
+import sys
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from datacls import PupilInformation
+
+def measure(pupils: list[PupilInformation], maxsize: int) -> float:
+    TextCache.clear()
+    TextCache.maxsize = maxsize
+    params = DiplomaParametrs()
+    params.diploma_school_name = "Муниципальное бюджетное общеобразовательное учреждение средняя школа № 1"
+    start = perf_counter()
+    pdf = DiplomaLayout(params, DiplomaTitleLayoutParametrs())
+    pdf.generate_title_lists(pupils, processes=1)
+    return perf_counter()-start
+
+def main(count: int = 1000) -> None:
+    pupils = make_pupils(count)
+    maxsize = TextCache.maxsize
+    for name, size in (("uncached", 0), ("cached", maxsize)):
+        elapsed = measure(pupils, size)
+        stats = TextCache.get_stats()
+        print(f"{name:>8}: {count} pupils, {elapsed:.2f} s, {stats['hits']} hits, {stats['misses']} misses")
+    TextCache.maxsize = maxsize
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+from diploma import DiplomaLayout, QRCodeCache, generate_title_files
+from file_parsing import open_parser
+from saving import Saver
+from storage import ParsedCache
+import sys
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from argparse import Namespace
+    from collections.abc import Iterable
+    from datacls import PupilInformation
+
+
+def render(args: Namespace) -> int:
+    saver = Saver(args.settings)
+    parser = open_parser(args.input) if not args.parse_cache or args.input == "-" else None
+    pupils: Iterable[PupilInformation]
+    if parser is None:
+        table = ParsedCache(args.parse_cache).parse(args.input)
+        pupils = [table.get_full_info(i) for i in range(len(table.pupils))] if args.supplement else table.pupils
+    else:
+        pupils = parser.iter_pupils_full_info() if args.supplement else parser.iter_pupils_info()
+    qrcode_cache = QRCodeCache(args.qr_cache) if args.qr_cache else None
+
+    if args.split:
+        files = generate_title_files(saver.get_diploma_parametrs(), saver.get_title_parametrs(), pupils, args.out, args.split, args.processes, args.vector_qr, qrcode_cache, args.supplement)
+        if parser is not None:
+            parser.close()
+        if not files:
+            print("В списке нет выпускников, чтобы распечатать аттестат(ы).", file=sys.stderr)
+            return 1
+        return 0
+
+    pdf = DiplomaLayout(saver.get_diploma_parametrs(), saver.get_title_parametrs(), vector_qrcode=args.vector_qr, qrcode_cache=qrcode_cache, print_supplement=args.supplement)
+    pdf.generate_title_lists(pupils, args.processes)
+    if parser is not None:
+        parser.close()
+    if pdf.pdf.pages_count == 0:
+        print("В списке нет выпускников, чтобы распечатать аттестат(ы).", file=sys.stderr)
+        return 1
+    if args.out == "-":
+        sys.stdout.buffer.write(pdf.get_bytes())
+    else:
+        pdf.save_file(args.out)
+    return 0
+
+def get_argument_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="python -m cli", description="Печать титульных листов аттестатов без графического интерфейса.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    render_parser = subparsers.add_parser("render", help="распечатать титульные листы всех выпускников из файла")
+    render_parser.add_argument("--input", required=True, help="файл с данными выпускников: Excel (.xlsx), CSV (.csv), TSV (.tsv) или JSON lines (.jsonl), - для чтения JSON lines из stdin")
+    render_parser.add_argument("--settings", default="settings.ini", help="файл настроек (по умолчанию settings.ini)")
+    render_parser.add_argument("--out", default="tests/test.pdf", help="итоговый PDF файл, - для вывода в stdout, или папка при --split (по умолчанию tests/test.pdf)")
+    render_parser.add_argument("--vector-qr", action="store_true", help="рисовать QR код векторными прямоугольниками вместо PNG")
+    render_parser.add_argument("--processes", type=int, default=None, help="число процессов для кодирования QR кодов (по умолчанию по числу ядер)")
+    render_parser.add_argument("--qr-cache", default=None, help="папка для кэша QR кодов, чтобы при повторной печати кодировать только изменённых выпускников")
+    render_parser.add_argument("--split", type=int, default=0, help="сохранять по N выпускников в отдельные файлы в папку --out (1 - файл на выпускника с именем по номеру аттестата)")
+    render_parser.add_argument("--parse-cache", default=None, help="папка для кэша разобранных файлов, чтобы не читать неизменённый файл заново")
+    render_parser.add_argument("--supplement", action="store_true", help="печатать после каждого титульного листа приложение с оценками")
+    render_parser.set_defaults(func=render)
+
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    args = get_argument_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
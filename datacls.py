@@ -1,10 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date
+from array import array
 
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterable
 
 @dataclass()
 class DiplomaParametrs:
@@ -34,7 +35,46 @@ class DiplomaTitleLayoutParametrs:
     qrcode: Point = field(default_factory=lambda: Point(9.1, 117))
     diploma_title_image: bool = False
 
-@dataclass()
+@dataclass(frozen=True)
+class TitleLayoutContext:
+    font_size: int
+    fst_font_size: int
+    font_height: float
+    title_image: bool
+    date_text: str
+    date_point: Point
+    year_text: str
+    year_point: Point
+    school_name: str
+    school_name_point: Point
+    head_of_edu_fst: str
+    head_of_edu_fst_point: Point
+    pupil_fst_point: Point
+    qrcode_point: Point
+    qrcode_date: str
+
+@dataclass(frozen=True)
+class SupplementLine:
+    page: int
+    subject: Point
+    grade: Point
+
+@dataclass(frozen=True)
+class SupplementLayoutContext:
+    subjects: tuple[str, ...]
+    font_size: int
+    line_height: float
+    subject_width: float
+    grade_width: float
+    grade_align: str
+    grade_texts: dict[int, str]
+    z_field: int
+    pages: int
+    header_point: Point
+    lines: tuple[SupplementLine, ...]
+    z_blocks: tuple[tuple[int, Point, Point], ...]
+
+@dataclass(slots=True)
 class PupilInformation:
     second_name: str
     name: str
@@ -42,9 +82,73 @@ class PupilInformation:
     birthday: date
     diploma_id: str
 
-@dataclass()
+class Ratings:
+    __slots__ = ("subjects", "columns", "values")
+    EMPTY = -1
+    MAX_VALUE = 127
+
+    def __init__(self, subjects: tuple[str, ...]) -> None:
+        self.subjects = subjects
+        self.columns = {subject: i for i, subject in enumerate(subjects)}
+        self.values = array("b")
+
+    def __len__(self) -> int:
+        if not self.subjects:
+            return 0
+        return len(self.values)//len(self.subjects)
+
+    def append(self, row: Iterable[Any]) -> int:
+        n = len(self.subjects)
+        values = [self.to_value(v) for v in row][:n]
+        values.extend([self.EMPTY]*(n-len(values)))
+        self.values.extend(values)
+        return len(self)-1
+
+    def to_value(self, v: Any) -> int:
+        try:
+            v = int(v)
+        except (TypeError, ValueError):
+            return self.EMPTY
+        return v if 0 <= v <= self.MAX_VALUE else self.EMPTY
+
+    def get(self, index: int, subject: str) -> int | None:
+        v = self.values[index*len(self.subjects)+self.columns[subject]]
+        return None if v == self.EMPTY else v
+
+    def set(self, index: int, subject: str, value: int | None) -> None:
+        self.values[index*len(self.subjects)+self.columns[subject]] = self.EMPTY if value is None else value
+
+    def row(self, index: int) -> array[int]:
+        n = len(self.subjects)
+        return self.values[index*n:(index+1)*n]
+
+    def column(self, subject: str) -> array[int]:
+        return self.values[self.columns[subject]::len(self.subjects)]
+
+@dataclass(slots=True)
 class PupilFullInformation(PupilInformation):
-    ratings: dict[str, int]
+    ratings: Ratings
+    index: int
+
+    def get_rating(self, subject: str) -> int | None:
+        return self.ratings.get(self.index, subject)
+
+@dataclass()
+class PupilsTable:
+    pupils: list[PupilInformation]
+    ratings: Ratings
+
+    @property
+    def subjects(self) -> tuple[str, ...]:
+        return self.ratings.subjects
+
+    def get_full_info(self, index: int) -> PupilFullInformation:
+        p = self.pupils[index]
+        return PupilFullInformation(p.second_name, p.name, p.third_name, p.birthday, p.diploma_id, self.ratings, index)
+
+    def extend(self, table: PupilsTable) -> None:
+        self.pupils.extend(table.pupils)
+        self.ratings.values.extend(table.ratings.values)
 
 Parametrs = TypeVar("Parametrs", DiplomaParametrs, DiplomaTitleLayoutParametrs)
 Information = TypeVar("Information", PupilInformation, PupilFullInformation)
\ No newline at end of file
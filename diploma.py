@@ -1,12 +1,150 @@
 from __future__ import annotations
 import fpdf
+from fpdf.fonts import SubsetMap
+from fpdf.image_parsing import preload_image
+from fontTools.ttLib import TTFont
 from segno import make_qr
-from os import remove, path, mkdir
+from copy import copy
+from io import BytesIO
+from os import path, makedirs, cpu_count, utime
+from hashlib import sha256
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from functools import partial
+from itertools import repeat, islice
+from collections import OrderedDict
+from collections.abc import Sized
+from storage import evict_files, write_file_atomic
+from datacls import Point, TitleLayoutContext, SupplementLayoutContext, SupplementLine, PupilFullInformation
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from main import MainWindow
-    from datacls import PupilInformation
+    from collections.abc import Iterable, Iterator, Generator, Callable, Hashable
+    from typing import Any
+    from segno import QRCode
+    from fpdf.fonts import TTFFont
+    from fpdf.image_datastructures import ImageInfo
+    from datacls import PupilInformation, DiplomaParametrs, DiplomaTitleLayoutParametrs
+
+class FontCache:
+    fonts: dict[str, TTFFont] = {}
+    files: dict[str, bytes] = {}
+
+    @classmethod
+    def add_font(cls, pdf: fpdf.FPDF, family: str, file: str) -> None:
+        fontkey = family.lower()
+        template = cls.fonts.get(file)
+        if template is None:
+            pdf.add_font(family, "", file)
+            with open(file, "rb") as f:
+                cls.files[file] = f.read()
+            cls.fonts[file] = copy(pdf.fonts[fontkey])
+            return
+
+        # Разобранные метрики и ширины символов общие, а таблицы шрифта и подмножество символов у каждого документа свои
+        font = copy(template)
+        font.i = len(pdf.fonts)+1
+        font.fontkey = fontkey
+        font.ttfont = TTFont(BytesIO(cls.files[file]), recalcTimestamp=False, fontNumber=0, lazy=True)
+        font.missing_glyphs = []
+        identities = "\x00 \r\n"
+        if pdf.str_alias_nb_pages:
+            identities += "0123456789"+pdf.str_alias_nb_pages
+        font.subset = SubsetMap(font, [ord(char) for char in identities])
+        pdf.fonts[fontkey] = font
+
+class ImageCache:
+    images: dict[str, ImageInfo] = {}
+
+    @classmethod
+    def preload_image(cls, pdf: fpdf.FPDF, file: str) -> None:
+        if file in pdf.image_cache.images:
+            return
+        info = cls.images.get(file)
+        if info is None:
+            _, _, info = preload_image(pdf.image_cache, file)
+            info["usages"] = 0
+            if info.get("iccp") is None:
+                cls.images[file] = copy(info)
+            return
+
+        info = copy(info)
+        info["i"] = len(pdf.image_cache.images)+1
+        pdf.image_cache.images[file] = info
+
+class TextCache:
+    maxsize = 4096
+    entries: OrderedDict[Hashable, Any] = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(cls, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = cls.entries.get(key)
+        if value is None:
+            cls.misses += 1
+            value = cls.entries[key] = compute()
+            if len(cls.entries) > cls.maxsize:
+                cls.entries.popitem(last=False)
+            return value
+        cls.hits += 1
+        cls.entries.move_to_end(key)
+        return value
+
+    @classmethod
+    def get_string_width(cls, pdf: fpdf.FPDF, text: str) -> float:
+        key = ("width", pdf.current_font.ttffile, pdf.font_size_pt, text) # type: ignore
+        return cls.get(key, partial(pdf.get_string_width, text))
+
+    @classmethod
+    def get_lines(cls, pdf: fpdf.FPDF, w: float, text: str) -> tuple[str, ...]:
+        key = ("lines", pdf.current_font.ttffile, pdf.font_size_pt, w, text) # type: ignore
+        return cls.get(key, lambda: tuple(pdf.multi_cell(w=w, text=text, dry_run=True, output="LINES"))) # type: ignore
+
+    @classmethod
+    def get_stats(cls) -> dict[str, int]:
+        return {"hits": cls.hits, "misses": cls.misses, "size": len(cls.entries)}
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.entries.clear()
+        cls.hits = 0
+        cls.misses = 0
+
+def make_qrcode_png(data: str, border: int) -> bytes:
+    buffer = BytesIO()
+    make_qr(data).save(buffer, kind="png", border=border)
+    return buffer.getvalue()
+
+class QRCodeCache:
+    def __init__(self, directory: str, max_size: int = 64 << 20, max_age: float = 30*24*3600) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+        makedirs(directory, exist_ok=True)
+        self.evict()
+
+    def get_path(self, key: str) -> str:
+        return path.join(self.directory, sha256(key.encode()).hexdigest()+".png")
+
+    def get(self, key: str) -> bytes | None:
+        entry = self.get_path(key)
+        try:
+            with open(entry, "rb") as f:
+                png = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            utime(entry)
+        except OSError:
+            pass
+        return png
+
+    def put(self, key: str, png: bytes) -> None:
+        write_file_atomic(self.get_path(key), png)
+
+    def evict(self) -> None:
+        evict_files(self.directory, ".png", self.max_size, self.max_age)
 
 class DiplomaLayout:
     months = (
@@ -25,57 +163,325 @@ class DiplomaLayout:
         "декабря",
     )
 
-    def __init__(self, window: MainWindow) -> None:
+    qrcode_size = 20
+    qrcode_border = 4
+    grades = {
+        5: "отлично",
+        4: "хорошо",
+        3: "удовлетворительно",
+        2: "неудовлетворительно",
+    }
+    grade_abbreviations = {
+        5: "отл.",
+        4: "хор.",
+        3: "удовл.",
+        2: "неуд.",
+    }
+    parallel_threshold = 50
+    parallel_chunk_size = 1000
+
+    def __init__(self, diploma_params: DiplomaParametrs, title_params: DiplomaTitleLayoutParametrs, vector_qrcode: bool = False, qrcode_cache: QRCodeCache | None = None, print_supplement: bool = False) -> None:
         self.pdf = fpdf.FPDF(orientation="L", unit="mm", format="A4")
         self.pdf.set_margin(0)
-        self.pdf.add_font("TimesNR","","src/fonts/Times_New_Roman.ttf")
+        FontCache.add_font(self.pdf, "TimesNR", "src/fonts/Times_New_Roman.ttf")
 
         self.title = {"width": 220, "height": 155, "start_x": self.pdf.epw-220, "start_y": self.pdf.eph/2-155/2, "end_x": self.pdf.epw, "end_y": self.pdf.eph/2+155/2}
-        self.window = window
+        self.supplement = {"start_x": 10, "start_y": 25, "header_y": 12, "column_gap": 17, "columns": 2, "lines": 24, "line_height": 7, "subject_width": 95, "grade_width": 40}
+        self.diploma_params = diploma_params
+        self.title_params = title_params
+        self.vector_qrcode = vector_qrcode
+        self.qrcode_cache = qrcode_cache
+        self.print_supplement = print_supplement
+        self.context = self.make_title_context()
+        self.supplement_context: SupplementLayoutContext | None = None
 
-    def generate_title_list(self, pupil: PupilInformation) -> None:
-        diploma_params = self.window.get_diploma_parametrs()
-        title_params = self.window.get_title_parametrs()
-        self.pdf.add_page()
-        self.pdf.set_font(family="TimesNR", style="", size=self.window.ui.diploma_font_size.value())
-        font_height = self.pdf.font_size
+    def generate_title_lists(self, pupils: Iterable[PupilInformation], processes: int | None = None, progress: Callable[[int], bool] | None = None) -> bool:
+        pages = self.iter_title_qrcodes(pupils, processes)
+        try:
+            return self.generate_title_pages(pages, progress)
+        finally:
+            pages.close()
 
-        if title_params.diploma_title_image:
-            self.pdf.image("src/diploma_title.png", w=self.title["width"], h=self.title["height"], x=self.title["start_x"], y=self.title["start_y"])
+    def iter_title_qrcodes(self, pupils: Iterable[PupilInformation], processes: int | None = None) -> Generator[tuple[PupilInformation, QRCode | bytes | None], None, None]:
+        if processes is None:
+            processes = cpu_count() or 1
+        if processes <= 1 or isinstance(pupils, Sized) and len(pupils) < self.parallel_threshold:
+            yield from zip(pupils, repeat(None))
+            return
+
+        rows = iter(pupils)
+        executor = ProcessPoolExecutor(processes, mp_context=get_context("spawn"))
+        try:
+            chunk = self.prepare_title_chunk(rows, executor, processes)
+            while chunk[0]:
+                pupils, qrcodes = chunk
+                chunk = self.prepare_title_chunk(rows, executor, processes)
+                yield from zip(pupils, qrcodes)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def prepare_title_chunk(self, rows: Iterator[PupilInformation], executor: ProcessPoolExecutor, processes: int) -> tuple[list[PupilInformation], Iterable[QRCode | bytes | None]]:
+        pupils = list(islice(rows, self.parallel_chunk_size))
+        qrcodes = [self.get_cached_qrcode(pupil) for pupil in pupils]
+        missing = [pupil for pupil, qrcode in zip(pupils, qrcodes) if qrcode is None]
+        if len(missing) < self.parallel_threshold:
+            return pupils, qrcodes
+
+        worker = make_qr if self.vector_qrcode else partial(make_qrcode_png, border=self.qrcode_border)
+        data = [self.get_qrcode_data(pupil) for pupil in missing]
+        encoded = zip(missing, executor.map(worker, data, chunksize=max(1, len(data)//(processes*4))))
+
+        def fill_missing() -> Iterator[QRCode | bytes]:
+            for qrcode in qrcodes:
+                if qrcode is None:
+                    pupil, qrcode = next(encoded)
+                    self.put_cached_qrcode(pupil, qrcode)
+                yield qrcode
+
+        return pupils, fill_missing()
+
+    def generate_title_pages(self, pages: Iterable[tuple[PupilInformation, QRCode | bytes | None]], progress: Callable[[int], bool] | None = None) -> bool:
+        for i, (pupil, qrcode) in enumerate(pages):
+            self.generate_title_list(pupil, qrcode)
+            if self.print_supplement and isinstance(pupil, PupilFullInformation):
+                self.generate_supplement_list(pupil)
+            if progress is not None and not progress(i+1):
+                return False
+        return True
+
+    def get_qrcode_key(self, pupil: PupilInformation) -> str:
+        return f"png|{self.qrcode_border}|{self.get_qrcode_data(pupil)}"
+
+    def get_cached_qrcode(self, pupil: PupilInformation) -> bytes | None:
+        if self.qrcode_cache is None or self.vector_qrcode:
+            return None
+        return self.qrcode_cache.get(self.get_qrcode_key(pupil))
+
+    def put_cached_qrcode(self, pupil: PupilInformation, qrcode: QRCode | bytes) -> None:
+        if self.qrcode_cache is not None and isinstance(qrcode, bytes):
+            self.qrcode_cache.put(self.get_qrcode_key(pupil), qrcode)
+
+    def make_qrcode(self, pupil: PupilInformation) -> QRCode | bytes:
+        if self.vector_qrcode:
+            return make_qr(self.get_qrcode_data(pupil))
+        qrcode = self.get_cached_qrcode(pupil)
+        if qrcode is None:
+            qrcode = make_qrcode_png(self.get_qrcode_data(pupil), self.qrcode_border)
+            self.put_cached_qrcode(pupil, qrcode)
+        return qrcode
+
+    def get_qrcode_data(self, pupil: PupilInformation) -> str:
+        return f"{pupil.second_name}|{pupil.name}|{pupil.third_name}|69|{pupil.diploma_id}|{self.context.qrcode_date}"
+
+    def make_title_context(self) -> TitleLayoutContext:
+        diploma_params = self.diploma_params
+        title_params = self.title_params
+        start_x = self.title["start_x"]
+        start_y = self.title["start_y"]
+        self.pdf.set_font(family="TimesNR", style="", size=diploma_params.diploma_font_size)
+        font_height = self.pdf.font_size
 
         d = diploma_params.diploma_date
         d_text = f"{d.day} {self.months[d.month]} {d.year} года"
-        d_width = self.pdf.get_string_width(d_text)
-        self.pdf.set_xy(self.title["start_x"]+title_params.date.x-d_width/2, self.title["start_y"]+title_params.date.y+font_height)
-        self.pdf.cell(text=d_text, align="C")
-
+        d_width = TextCache.get_string_width(self.pdf, d_text)
         y = str(d.year)
-        y_width = self.pdf.get_string_width(y)
-        self.pdf.set_xy(self.title["start_x"]+title_params.year.x-y_width/2, self.title["start_y"]+title_params.year.y-font_height)
-        self.pdf.cell(text=y, align="C")
-
-        school_name = diploma_params.diploma_school_name
-        self.pdf.set_xy(self.title["start_x"]+title_params.school_name.x, self.title["start_y"]+title_params.school_name.y-font_height*6/2)
-        self.pdf.multi_cell(w=50, text=school_name, align="C") # type: ignore
+        y_width = TextCache.get_string_width(self.pdf, y)
 
+        fst = ""
         if diploma_params.diploma_print_fst:
             fst = diploma_params.diploma_fst_head_of_edu
-            self.pdf.set_xy(self.title["start_x"]+title_params.head_of_edu_fst.x, self.title["start_y"]+title_params.head_of_edu_fst.y-font_height)
-            self.pdf.cell(text=fst, align="L")
 
-        self.pdf.set_font(family="TimesNR", style="", size=self.window.ui.diploma_FST_font_size.value())
+        return TitleLayoutContext(
+            diploma_params.diploma_font_size,
+            diploma_params.diploma_fst_font_size,
+            font_height,
+            title_params.diploma_title_image,
+            d_text,
+            Point(start_x+title_params.date.x-d_width/2, start_y+title_params.date.y+font_height),
+            y,
+            Point(start_x+title_params.year.x-y_width/2, start_y+title_params.year.y-font_height),
+            diploma_params.diploma_school_name,
+            Point(start_x+title_params.school_name.x, start_y+title_params.school_name.y-font_height*6/2),
+            fst,
+            Point(start_x+title_params.head_of_edu_fst.x, start_y+title_params.head_of_edu_fst.y-font_height),
+            Point(start_x+title_params.pupil_fst.x, start_y+title_params.pupil_fst.y+font_height),
+            Point(start_x+title_params.qrcode.x, start_y+title_params.qrcode.y),
+            d.strftime("%d-%m-%Y")
+        )
+
+    def generate_title_list(self, pupil: PupilInformation, qrcode: QRCode | bytes | None = None) -> None:
+        context = self.context
+        self.pdf.add_page()
+        self.pdf.set_font(family="TimesNR", style="", size=context.font_size)
+
+        if context.title_image:
+            ImageCache.preload_image(self.pdf, "src/diploma_title.png")
+            self.pdf.image("src/diploma_title.png", w=self.title["width"], h=self.title["height"], x=self.title["start_x"], y=self.title["start_y"])
+
+        self.pdf.set_xy(context.date_point.x, context.date_point.y)
+        self.pdf.cell(text=context.date_text, align="C")
+
+        self.pdf.set_xy(context.year_point.x, context.year_point.y)
+        self.pdf.cell(text=context.year_text, align="C")
+
+        self.pdf.set_xy(context.school_name_point.x, context.school_name_point.y)
+        self.write_lines(50, context.school_name, "C")
+
+        if context.head_of_edu_fst:
+            self.pdf.set_xy(context.head_of_edu_fst_point.x, context.head_of_edu_fst_point.y)
+            self.pdf.cell(text=context.head_of_edu_fst, align="L")
+
+        self.pdf.set_font(family="TimesNR", style="", size=context.fst_font_size)
         pupil_fst = f"{pupil.second_name} {pupil.name} {pupil.third_name}"
-        pupil_fst_width = self.pdf.get_string_width(pupil_fst)
-        self.pdf.set_xy(self.title["start_x"]+title_params.pupil_fst.x-pupil_fst_width/8, self.title["start_y"]+title_params.pupil_fst.y+font_height)
-        self.pdf.multi_cell(w=pupil_fst_width*3/4, text=pupil_fst, align="C") # type: ignore
-
-        qrcode = make_qr(f"{pupil.second_name}|{pupil.name}|{pupil.third_name}|69|{pupil.diploma_id}|{self.window.ui.diploma_date.date().toString('dd-MM-yyyy')}")
-        qrcode.save("dump.png")
-        self.pdf.set_xy(self.title["start_x"]+title_params.qrcode.x, self.title["start_y"]+title_params.qrcode.y)
-        self.pdf.image("dump.png", w=20, h=20)
-        remove("dump.png")
+        pupil_fst_width = TextCache.get_string_width(self.pdf, pupil_fst)
+        self.pdf.set_xy(context.pupil_fst_point.x-pupil_fst_width/8, context.pupil_fst_point.y)
+        self.write_lines(pupil_fst_width*3/4, pupil_fst, "C")
+
+        x = context.qrcode_point.x
+        y = context.qrcode_point.y
+        if qrcode is None:
+            qrcode = self.make_qrcode(pupil)
+        if isinstance(qrcode, bytes):
+            self.pdf.set_xy(x, y)
+            self.pdf.image(BytesIO(qrcode), w=self.qrcode_size, h=self.qrcode_size)
+        else:
+            self.draw_qrcode(qrcode, x, y)
+
+    def write_lines(self, w: float, text: str, align: str) -> None:
+        for line in TextCache.get_lines(self.pdf, w, text):
+            self.pdf.cell(w=w, text=line, align=align, new_x="LEFT", new_y="NEXT") # type: ignore
+
+    def get_grade_text(self, grade: int) -> str:
+        transcript = self.diploma_params.rating_transcript
+        word = (self.grade_abbreviations if transcript == 1 else self.grades).get(grade)
+        if word is None or transcript == 2:
+            return str(grade)
+        return f"{grade} ({word})"
+
+    def make_supplement_context(self, subjects: tuple[str, ...]) -> SupplementLayoutContext:
+        s = self.supplement
+        column_width = s["subject_width"]+s["grade_width"]
+        capacity = s["columns"]*s["lines"]
+        pages = max(1, -(-len(subjects)//capacity))
+
+        lines: list[SupplementLine] = []
+        z_blocks: list[tuple[int, Point, Point]] = []
+        for page in range(pages):
+            for column in range(s["columns"]):
+                x = s["start_x"]+column*(column_width+s["column_gap"])
+                first_unused = None
+                for line in range(s["lines"]):
+                    y = s["start_y"]+line*s["line_height"]
+                    lines.append(SupplementLine(page, Point(x, y), Point(x+s["subject_width"], y)))
+                    if first_unused is None and len(lines) > len(subjects):
+                        first_unused = y
+                if first_unused is not None:
+                    z_blocks.append((page, Point(x, first_unused), Point(x+column_width, s["start_y"]+s["lines"]*s["line_height"])))
+
+        return SupplementLayoutContext(
+            subjects,
+            self.diploma_params.diploma_adv_font_size,
+            s["line_height"],
+            s["subject_width"],
+            s["grade_width"],
+            "C" if self.diploma_params.ali_rating == 1 else "L",
+            {grade: self.get_grade_text(grade) for grade in range(128)},
+            self.diploma_params.z_field,
+            pages,
+            Point(s["start_x"], s["header_y"]),
+            tuple(lines),
+            tuple(z_blocks)
+        )
+
+    def generate_supplement_list(self, pupil: PupilFullInformation) -> None:
+        if self.supplement_context is None or self.supplement_context.subjects != pupil.ratings.subjects:
+            self.supplement_context = self.make_supplement_context(pupil.ratings.subjects)
+        context = self.supplement_context
+        row = pupil.ratings.row(pupil.index)
+        h = context.line_height
+
+        for page in range(context.pages):
+            self.pdf.add_page()
+            self.pdf.set_font(family="TimesNR", style="", size=context.font_size)
+            self.pdf.set_xy(context.header_point.x, context.header_point.y)
+            self.pdf.cell(text=f"{pupil.second_name} {pupil.name} {pupil.third_name}, аттестат № {pupil.diploma_id}", align="L")
+
+            for i, line in enumerate(context.lines):
+                if line.page != page:
+                    continue
+                if i >= len(context.subjects):
+                    if context.z_field == 0:
+                        self.pdf.set_xy(line.subject.x, line.subject.y)
+                        self.pdf.cell(w=context.subject_width+context.grade_width, h=h, text="Z", align="C")
+                    continue
+
+                self.pdf.set_xy(line.subject.x, line.subject.y)
+                self.pdf.cell(w=context.subject_width, h=h, text=context.subjects[i], align="L")
+                grade = row[i]
+                if grade != pupil.ratings.EMPTY:
+                    self.pdf.set_xy(line.grade.x, line.grade.y)
+                    self.pdf.cell(w=context.grade_width, h=h, text=context.grade_texts[grade], align=context.grade_align)
+                elif context.z_field == 0:
+                    self.pdf.set_xy(line.grade.x, line.grade.y)
+                    self.pdf.cell(w=context.grade_width, h=h, text="Z", align=context.grade_align)
+
+            if context.z_field == 1:
+                for block_page, top_left, bottom_right in context.z_blocks:
+                    if block_page == page:
+                        self.pdf.line(top_left.x, top_left.y, bottom_right.x, top_left.y)
+                        self.pdf.line(bottom_right.x, top_left.y, top_left.x, bottom_right.y)
+                        self.pdf.line(top_left.x, bottom_right.y, bottom_right.x, bottom_right.y)
+
+    def draw_qrcode(self, qrcode: QRCode, x: float, y: float) -> None:
+        width, _ = qrcode.symbol_size(border=self.qrcode_border)
+        module = self.qrcode_size/width
+        self.pdf.set_fill_color(0)
+        for i, row in enumerate(qrcode.matrix_iter(border=self.qrcode_border)):
+            start = None
+            for j, dark in enumerate(row):
+                if dark and start is None:
+                    start = j
+                elif not dark and start is not None:
+                    self.pdf.rect(x+start*module, y+i*module, (j-start)*module, module, style="F")
+                    start = None
+            if start is not None:
+                self.pdf.rect(x+start*module, y+i*module, (width-start)*module, module, style="F")
     
-    def save_file(self) -> None:
-        if not path.isdir("tests"):
-            mkdir("tests")
-        self.pdf.output("tests/test.pdf")
\ No newline at end of file
+    def get_bytes(self) -> bytes:
+        return bytes(self.pdf.output())
+
+    def save_file(self, file: str = "tests/test.pdf") -> None:
+        write_file_atomic(file, self.pdf.output())
+
+def get_split_file_name(diploma_id: str | None, number: int, used: set[str]) -> str:
+    name = "" if diploma_id is None else str(diploma_id)
+    name = "".join("_" if char in '<>:"/\\|?*' or ord(char) < 32 else char for char in name).strip(" .")
+    if not name:
+        name = f"{number:05}"
+    unique = name
+    suffix = 1
+    while unique.lower() in used:
+        suffix += 1
+        unique = f"{name}_{suffix}"
+    used.add(unique.lower())
+    return unique+".pdf"
+
+def generate_title_files(diploma_params: DiplomaParametrs, title_params: DiplomaTitleLayoutParametrs, pupils: Iterable[PupilInformation], directory: str, chunk_size: int = 1, processes: int | None = None, vector_qrcode: bool = False, qrcode_cache: QRCodeCache | None = None, print_supplement: bool = False) -> list[str]:
+    files: list[str] = []
+    used: set[str] = set()
+    pages = DiplomaLayout(diploma_params, title_params, vector_qrcode, qrcode_cache).iter_title_qrcodes(pupils, processes)
+    try:
+        while True:
+            chunk = list(islice(pages, chunk_size))
+            if not chunk:
+                return files
+            pdf = DiplomaLayout(diploma_params, title_params, vector_qrcode, qrcode_cache, print_supplement)
+            pdf.generate_title_pages(chunk)
+            if chunk_size == 1:
+                file = path.join(directory, get_split_file_name(chunk[0][0].diploma_id, len(files)+1, used))
+            else:
+                file = path.join(directory, f"{len(files)+1:05}.pdf")
+            pdf.save_file(file)
+            files.append(file)
+    finally:
+        pages.close()
@@ -1,44 +1,181 @@
 from __future__ import annotations
-from openpyxl import load_workbook
+from abc import ABC, abstractmethod
 from datetime import date
-from datacls import PupilInformation, PupilFullInformation
+from itertools import chain, islice
+from os import path
+import csv
+import json
+import sys
+from datacls import PupilInformation, PupilFullInformation, PupilsTable, Ratings
 
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterator
+    from typing import TextIO
 
-class ExcelParser:
+class PupilsParser(ABC):
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def iter_rows(self) -> Iterator[tuple[Any, ...]]:
+        ...
+
+    def get_rows_count(self) -> int:
+        return 0
+
+    def get_subjects(self) -> tuple[str]:
+        header = next(self.iter_rows(), None)
+        if header is None:
+            return tuple() # type: ignore
+        return tuple(header[7:]) # type: ignore
+
+    def is_empty_row(self, row: tuple[Any, ...]) -> bool:
+        return all(v is None for v in row[:7])
+
+    def row_to_pupil_info(self, row: tuple[Any, ...]) -> PupilInformation:
+        return PupilInformation(row[0], row[1], row[2], date(int(row[5]), int(row[4]), int(row[3])), row[6])
+
+    def iter_pupils_info(self) -> Iterator[PupilInformation]:
+        for row in islice(self.iter_rows(), 1, None):
+            if not self.is_empty_row(row):
+                yield self.row_to_pupil_info(row)
+
+    def get_pupils_info(self) -> tuple[PupilInformation]:
+        return tuple(self.iter_pupils_info()) # type: ignore
+
+    def iter_pupils_rows(self, ratings: Ratings, rows: Iterator[tuple[Any, ...]]) -> Iterator[PupilInformation]:
+        for row in rows:
+            if self.is_empty_row(row):
+                continue
+            ratings.append(row[7:])
+            yield self.row_to_pupil_info(row)
+
+    def iter_pupils_full_info(self) -> Iterator[PupilFullInformation]:
+        rows = self.iter_rows()
+        header = next(rows, None)
+        if header is None:
+            return
+        ratings = Ratings(tuple(header[7:]))
+        for i, p in enumerate(self.iter_pupils_rows(ratings, rows)):
+            yield PupilFullInformation(p.second_name, p.name, p.third_name, p.birthday, p.diploma_id, ratings, i)
+
+    def get_pupils_full_info(self) -> tuple[PupilFullInformation, ...]:
+        return tuple(self.iter_pupils_full_info())
+
+    def parse(self) -> PupilsTable:
+        rows = self.iter_rows()
+        header = next(rows, None)
+        if header is None:
+            return PupilsTable([], Ratings(tuple()))
+        ratings = Ratings(tuple(header[7:]))
+        return PupilsTable(list(self.iter_pupils_rows(ratings, rows)), ratings)
+
+    def iter_tables(self, size: int) -> Iterator[PupilsTable]:
+        rows = self.iter_rows()
+        header = next(rows, None)
+        subjects = tuple(header[7:]) if header is not None else tuple()
+        while True:
+            ratings = Ratings(subjects)
+            table = PupilsTable(list(islice(self.iter_pupils_rows(ratings, rows), size)), ratings)
+            yield table
+            if len(table.pupils) < size:
+                return
+
+class ExcelParser(PupilsParser):
     def __init__(self, file: str) -> None:
-        self.workbook = load_workbook(file, read_only=False)
+        from openpyxl import load_workbook
+
+        self.workbook = load_workbook(file, read_only=True)
         self.ws = self.workbook.active
 
+    def close(self) -> None:
+        self.workbook.close()
+
+    def iter_rows(self) -> Iterator[tuple[Any, ...]]:
+        return self.ws.iter_rows(values_only=True) # type: ignore
+
     def get_subjects(self) -> tuple[str]:
         for row in self.ws.iter_rows(min_col=8, max_row=1, values_only=True): # type: ignore
             return row # type: ignore
         return tuple()
 
-    def get_pupils_info(self) -> tuple[PupilInformation]:
-        l: list[PupilInformation] = []
+    def iter_pupils_info(self) -> Iterator[PupilInformation]:
         for row in self.ws.iter_rows(min_row=2, max_col=7, values_only=True): # type: ignore
-            row: list[Any] = list(row) # type: ignore
-            d = date(row.pop(5), row.pop(4), row.pop(3))
-            row.insert(3, d)
-            l.append(PupilInformation(*row))
-        return tuple(l) # type: ignore
-    
-    def get_pupils_full_info(self) -> tuple[PupilFullInformation, ...]:
-        subjects = self.get_subjects()
-        pupils = list(self.get_pupils_info())
+            if not self.is_empty_row(row):
+                yield self.row_to_pupil_info(row)
+
+    def get_rows_count(self) -> int:
+        return max((self.ws.max_row or 0)-1, 0) # type: ignore
+
+class TextParser(PupilsParser):
+    def __init__(self, file: str, encoding: str = "utf-8-sig") -> None:
+        self.file = file
+        if file == "-":
+            self.stream: TextIO = sys.stdin
+        else:
+            self.stream = open(file, encoding=encoding, newline="")
+
+    def close(self) -> None:
+        if self.stream is not sys.stdin:
+            self.stream.close()
+
+    def iter_rows(self) -> Iterator[tuple[Any, ...]]:
+        if self.stream is not sys.stdin:
+            self.stream.seek(0)
+        for row in self.iter_raw_rows():
+            yield tuple(None if v == "" else v for v in row)
+
+    @abstractmethod
+    def iter_raw_rows(self) -> Iterator[list[Any]]:
+        ...
+
+    def get_rows_count(self) -> int:
+        if self.file == "-":
+            return 0
+        lines = 0
+        with open(self.file, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                lines += block.count(b"\n")
+        return max(lines-1, 0)
+
+class CsvParser(TextParser):
+    delimiters = ",;\t"
+
+    def __init__(self, file: str, encoding: str = "utf-8-sig", delimiter: str | None = None) -> None:
+        super().__init__(file, encoding)
+        self.delimiter = delimiter
 
-        r: list[list[int]] = []
-        for row in self.ws.iter_rows(min_row=2, min_col=8, values_only=True): # type: ignore
-            r.append(row) # type: ignore
+    def iter_raw_rows(self) -> Iterator[list[Any]]:
+        first = self.stream.readline()
+        if not first:
+            return
+        delimiter = self.delimiter
+        if delimiter is None:
+            try:
+                delimiter = csv.Sniffer().sniff(first, self.delimiters).delimiter
+            except csv.Error:
+                delimiter = ","
+        yield from csv.reader(chain((first,), self.stream), delimiter=delimiter)
 
-        for i, pupil in enumerate(pupils):
-            d: dict[str, int] = {}
-            for j, subject in enumerate(subjects):
-                d.update({subject: r[i][j]})
-            pupil = PupilFullInformation(pupil.second_name, pupil.name, pupil.third_name, pupil.birthday, pupil.diploma_id, d)
-            pupils[i] = pupil
+class JsonLinesParser(TextParser):
+    def iter_raw_rows(self) -> Iterator[list[Any]]:
+        for i, line in enumerate(self.stream, 1):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if not isinstance(row, list):
+                raise ValueError(f"Строка {i}: ожидался массив значений JSON.")
+            yield row
 
-        return tuple(pupils) # type: ignore
\ No newline at end of file
+def open_parser(file: str) -> PupilsParser:
+    if file == "-":
+        return JsonLinesParser(file)
+    extension = path.splitext(file)[1].lower()
+    if extension == ".csv":
+        return CsvParser(file)
+    if extension in (".tsv", ".tab"):
+        return CsvParser(file, delimiter="\t")
+    if extension in (".jsonl", ".ndjson"):
+        return JsonLinesParser(file)
+    return ExcelParser(file)
@@ -1,22 +1,32 @@
 from __future__ import annotations
-from datacls import DiplomaParametrs, PupilFullInformation, PupilInformation, DiplomaTitleLayoutParametrs, Point
-from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QTableWidgetItem, QMessageBox
-from PySide6.QtCore import Slot, QDate
-from diploma import DiplomaLayout
+from datacls import DiplomaParametrs, PupilFullInformation, DiplomaTitleLayoutParametrs, Point, Ratings, PupilsTable
+from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox, QProgressDialog
+from PySide6.QtCore import Slot, QDate, QModelIndex, Qt, QThreadPool, QTimer
+from models import PupilsModel, RatingsModel
+from workers import LoadPupilsWorker, LoadSessionWorker, RenderDiplomasWorker
 from saving import Saver
+from storage import SessionFile
 from ui.main_ui import Ui_MainWindow
+from ui.title_layout_ui import Ui_TitleLayout
 import sys
+from os import path
 from datetime import date
-
-from file_parsing import ExcelParser
+from decimal import Decimal, ROUND_HALF_UP
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from PySide6.QtGui import QCloseEvent
     from PySide6.QtWidgets import QRadioButton
 
 
 class MainWindow(QMainWindow):
-    FILE_FILTERS = ("Excel (*.xlsx)",)
+    FILE_FILTERS = ("Excel (*.xlsx)", "CSV (*.csv *.tsv)", "JSON lines (*.jsonl *.ndjson)")
+    OUTPUT_FILTERS = ("PDF (*.pdf)",)
+    SESSION_FILE = "session.bin"
+    AUTOSAVE_INTERVAL = 2000
+    TITLE_DECIMALS = 1
+    TITLE_MINIMUM = 0.0
+    TITLE_MAXIMUM = 220.0
 
     def __init__(self) -> None:
         super().__init__()
@@ -41,6 +51,22 @@ class MainWindow(QMainWindow):
             self.ui.no_print
         )
 
+        self.pupils_model = PupilsModel(parent=self)
+        self.ratings_model = RatingsModel(parent=self)
+        self.ui.pupils_list.setModel(self.pupils_model)
+        self.ui.rating_list.setModel(self.ratings_model)
+        self.pupils_model.dataChanged.connect(self.ratings_model.pupils_changed)
+
+        self.session = SessionFile(self.SESSION_FILE)
+        self.session_rows: set[int] = set()
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(self.AUTOSAVE_INTERVAL)
+        self.autosave_timer.timeout.connect(self.autosave_session)
+        self.pupils_model.dataChanged.connect(self.session_rows_changed)
+        self.ratings_model.dataChanged.connect(self.session_rows_changed)
+
+        self.output_file = "tests/test.pdf"
         self.saver = Saver("settings.ini")
         self.ui.diploma_school_name.blockCountChanged.connect(self.school_name_blocks_count_changed)
         self.ui.reset_diploma_settings.clicked.connect(self.reset_diploma_parametrs)
@@ -49,14 +75,17 @@ class MainWindow(QMainWindow):
         self.ui.load_pupils.clicked.connect(self.load_pupils)
         self.ui.generate_diploma.clicked.connect(self.generate_diploma)
         self.ui.generate_all_diplomas.clicked.connect(self.generate_all_diplomas)
-        self.ui.pupils_list.cellClicked.connect(self.cell_index_selected_from_pupils_list)
+        self.ui.pupils_list.clicked.connect(self.cell_index_selected_from_pupils_list)
         self.ui.selected_index.valueChanged.connect(self.cell_index_selected_from_selected_index)
 
-        self.ui.save_title_settings.clicked.connect(self.save_title_parametrs)
-        self.ui.reset_title_settings.clicked.connect(self.reset_title_parametrs)
+        self.title_ui: Ui_TitleLayout | None = None
+        self.title_params = DiplomaTitleLayoutParametrs()
+        self.ui.layout.currentChanged.connect(self.tab_changed)
 
         self.restore_diploma_parametrs()
         self.restore_title_parametrs()
+        if path.isfile(self.SESSION_FILE):
+            QTimer.singleShot(0, self.restore_session)
 
     def get_index_from_radio_buttons(self, t: tuple[QRadioButton, ...]) -> int:
         for i, rb in enumerate(t):
@@ -76,20 +105,40 @@ class MainWindow(QMainWindow):
         self.ui.diploma_adv_font_size.setValue(dp.diploma_adv_font_size)
         self.ui.diploma_FST_font_size.setValue(dp.diploma_fst_font_size)
     
+    def round_title_value(self, value: float) -> float:
+        value = min(max(value, self.TITLE_MINIMUM), self.TITLE_MAXIMUM)
+        return float(Decimal(value).quantize(Decimal(1).scaleb(-self.TITLE_DECIMALS), ROUND_HALF_UP))
+
+    def round_title_point(self, p: Point) -> Point:
+        return Point(self.round_title_value(p.x), self.round_title_value(p.y))
+
     def set_title_parametrs(self, tp: DiplomaTitleLayoutParametrs = DiplomaTitleLayoutParametrs()) -> None:
-        self.ui.title_date_x.setValue(tp.date.x)
-        self.ui.title_date_y.setValue(tp.date.y)
-        self.ui.title_year_x.setValue(tp.year.x)
-        self.ui.title_year_y.setValue(tp.year.y)
-        self.ui.title_school_name_x.setValue(tp.school_name.x)
-        self.ui.title_school_name_y.setValue(tp.school_name.y)
-        self.ui.title_head_of_edu_FST_x.setValue(tp.head_of_edu_fst.x)
-        self.ui.title_head_of_edu_FST_y.setValue(tp.head_of_edu_fst.y)
-        self.ui.title_pupil_FST_x.setValue(tp.pupil_fst.x)
-        self.ui.title_pupil_FST_y.setValue(tp.pupil_fst.y)
-        self.ui.title_qrcode_x.setValue(tp.qrcode.x)
-        self.ui.title_qrcode_y.setValue(tp.qrcode.y)
-        self.ui.title_image.setChecked(tp.diploma_title_image)
+        self.title_params = DiplomaTitleLayoutParametrs(
+            self.round_title_point(tp.date),
+            self.round_title_point(tp.year),
+            self.round_title_point(tp.school_name),
+            self.round_title_point(tp.head_of_edu_fst),
+            self.round_title_point(tp.pupil_fst),
+            self.round_title_point(tp.qrcode),
+            tp.diploma_title_image
+        )
+        tp = self.title_params
+        ui = self.title_ui
+        if ui is None:
+            return
+        ui.title_date_x.setValue(tp.date.x)
+        ui.title_date_y.setValue(tp.date.y)
+        ui.title_year_x.setValue(tp.year.x)
+        ui.title_year_y.setValue(tp.year.y)
+        ui.title_school_name_x.setValue(tp.school_name.x)
+        ui.title_school_name_y.setValue(tp.school_name.y)
+        ui.title_head_of_edu_FST_x.setValue(tp.head_of_edu_fst.x)
+        ui.title_head_of_edu_FST_y.setValue(tp.head_of_edu_fst.y)
+        ui.title_pupil_FST_x.setValue(tp.pupil_fst.x)
+        ui.title_pupil_FST_y.setValue(tp.pupil_fst.y)
+        ui.title_qrcode_x.setValue(tp.qrcode.x)
+        ui.title_qrcode_y.setValue(tp.qrcode.y)
+        ui.title_image.setChecked(tp.diploma_title_image)
 
     def get_diploma_parametrs(self) -> DiplomaParametrs:
         return DiplomaParametrs(
@@ -106,42 +155,42 @@ class MainWindow(QMainWindow):
         )
 
     def get_title_parametrs(self) -> DiplomaTitleLayoutParametrs:
+        ui = self.title_ui
+        if ui is None:
+            return self.title_params
         return DiplomaTitleLayoutParametrs(
-            Point(self.ui.title_date_x.value(), self.ui.title_date_y.value()),
-            Point(self.ui.title_year_x.value(), self.ui.title_year_y.value()),
-            Point(self.ui.title_school_name_x.value(), self.ui.title_school_name_y.value()),
-            Point(self.ui.title_head_of_edu_FST_x.value(), self.ui.title_head_of_edu_FST_y.value()),
-            Point(self.ui.title_pupil_FST_x.value(), self.ui.title_pupil_FST_y.value()),
-            Point(self.ui.title_qrcode_x.value(), self.ui.title_qrcode_y.value()),
-            self.ui.title_image.isChecked()
+            Point(ui.title_date_x.value(), ui.title_date_y.value()),
+            Point(ui.title_year_x.value(), ui.title_year_y.value()),
+            Point(ui.title_school_name_x.value(), ui.title_school_name_y.value()),
+            Point(ui.title_head_of_edu_FST_x.value(), ui.title_head_of_edu_FST_y.value()),
+            Point(ui.title_pupil_FST_x.value(), ui.title_pupil_FST_y.value()),
+            Point(ui.title_qrcode_x.value(), ui.title_qrcode_y.value()),
+            ui.title_image.isChecked()
         )
 
-    def get_pupil_info(self, index: int | None = None) -> PupilInformation:
-        if not index:
-            index = self.ui.selected_index.value()-1
-        data: list[str | date]= []
-        for x in range(self.ui.pupils_list.columnCount()):
-            d = self.ui.pupils_list.item(index, x).text()
-            if x == 3:
-                d = d.split(".")
-                d.reverse()
-                d = "-".join(d)
-                d = date.fromisoformat(d)
-            data.append(d)
-        return PupilInformation(*data) # type: ignore
-    
     def get_full_pupil_info(self, index: int | None = None) -> PupilFullInformation:
-        if not index:
+        if index is None:
             index = self.ui.selected_index.value()-1
-        pupil = self.get_pupil_info(index)
-        d: dict[str, int] = {}
-        for x in range(self.ui.rating_list.columnCount()):
-            k = self.ui.rating_list.horizontalHeaderItem(x).text()
-            v = int(self.ui.rating_list.item(index, x).text())
-            d[k] = v
-
-        return PupilFullInformation(pupil.second_name, pupil.name, pupil.third_name, pupil.birthday, pupil.diploma_id, d)
-    
+        return self.pupils_model.table.get_full_info(index)
+
+    def get_print_supplement(self) -> bool:
+        return self.ui.print_supplement.isChecked() and bool(self.pupils_model.table.subjects)
+
+    def get_output_file(self) -> str:
+        file = QFileDialog.getSaveFileName(self, caption="Выберите файл для сохранения", dir=self.output_file, filter=";;".join(self.OUTPUT_FILTERS))
+        if file[0]:
+            self.output_file = file[0]
+        return file[0]
+
+    def build_title_layout(self) -> None:
+        if self.title_ui is not None:
+            return
+        self.title_ui = Ui_TitleLayout()
+        self.title_ui.setupUi(self.ui.layout_params) # type: ignore
+        self.title_ui.save_title_settings.clicked.connect(self.save_title_parametrs)
+        self.title_ui.reset_title_settings.clicked.connect(self.reset_title_parametrs)
+        self.set_title_parametrs(self.title_params)
+
     def drop_error_message(self, title: str, message: str) -> int:
         return QMessageBox.critical(self, title, message)
 
@@ -171,6 +220,11 @@ class MainWindow(QMainWindow):
     def reset_title_parametrs(self):
         self.set_title_parametrs()
 
+    @Slot(int)
+    def tab_changed(self, index: int) -> None:
+        if self.ui.layout.widget(index) is self.ui.layout_params:
+            self.build_title_layout()
+
     @Slot(int)
     def school_name_blocks_count_changed(self, i: int) -> None:
         if i > 6:
@@ -178,94 +232,189 @@ class MainWindow(QMainWindow):
             cursor.deletePreviousChar()
             self.ui.diploma_school_name.setTextCursor(cursor)
 
-    @Slot(int, int)
-    def pupils_list_cell_changed(self, row: int, col: int) -> None:
-        if col <= 2:
-            pupil = (
-                self.ui.pupils_list.item(row,0).text(),
-                self.ui.pupils_list.item(row,1).text(),
-                self.ui.pupils_list.item(row,2).text()
-            )
-            header = QTableWidgetItem(f"{pupil[0]} {pupil[1]} {pupil[2]}")
-            self.ui.rating_list.setVerticalHeaderItem(row, header)
-
     @Slot()
     def load_pupils(self) -> None:
-        try:
-            self.ui.pupils_list.cellChanged.disconnect(self.pupils_list_cell_changed)
-        except RuntimeError:
-            pass
-
         file = QFileDialog.getOpenFileName(self, caption="Выберите файл для загрузки", filter=";;".join(self.FILE_FILTERS))
+        if not file[0]:
+            return
 
-        parser = ExcelParser(file[0])
-        subjects = parser.get_subjects()
-        pupils = parser.get_pupils_info()
-
-        self.ui.pupils_list.setRowCount(len(pupils))
-        for i, pupil in enumerate(pupils):
-            t = (
-                QTableWidgetItem(pupil.second_name),
-                QTableWidgetItem(pupil.name),
-                QTableWidgetItem(pupil.third_name),
-                QTableWidgetItem(pupil.birthday.strftime("%d.%m.%Y")),
-                QTableWidgetItem(pupil.diploma_id)
-            )
-
-            for j, item in enumerate(t):
-                self.ui.pupils_list.setItem(i,j,item)
-
-        full_info = parser.get_pupils_full_info()
-        self.ui.rating_list.setColumnCount(len(subjects))
-        self.ui.rating_list.setRowCount(len(full_info))
-        for i, subject in enumerate(subjects):
-            header = QTableWidgetItem(subject)
-            self.ui.rating_list.setHorizontalHeaderItem(i, header)
-
-        for i, pupil in enumerate(full_info):
-            header = QTableWidgetItem(f"{pupil.second_name} {pupil.name} {pupil.third_name}")
-            self.ui.rating_list.setVerticalHeaderItem(i, header)
-            for j, subject in enumerate(subjects):
-                rate = pupil.ratings.get(subject)
-                if rate is None:
-                    rate = ""
-                else:
-                    rate = str(rate)
-                item = QTableWidgetItem(rate)
-                self.ui.rating_list.setItem(i, j, item)
-
-        self.ui.pupils_list.cellChanged.connect(self.pupils_list_cell_changed)
+        self.start_loading(LoadPupilsWorker(file[0]))
+
+    @Slot()
+    def restore_session(self) -> None:
+        self.start_loading(LoadSessionWorker(self.session))
+
+    def start_loading(self, worker: LoadPupilsWorker | LoadSessionWorker) -> None:
+        self.flush_session()
+        self.previous_table = self.pupils_model.table
+        self.load_worker = worker
+        self.load_worker.signals.subjects.connect(self.pupils_subjects_loaded)
+        self.load_worker.signals.batch.connect(self.pupils_batch_loaded)
+        self.load_worker.signals.progress.connect(self.pupils_load_progress)
+        self.load_worker.signals.finished.connect(self.pupils_load_finished)
+        self.load_worker.signals.error.connect(self.pupils_load_error)
+
+        self.load_progress = QProgressDialog("Загрузка выпускников...", "Отмена", 0, 0, self)
+        self.load_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.load_progress.setMinimumDuration(0)
+        self.load_progress.setAutoReset(False)
+        self.load_progress.setAutoClose(False)
+        self.load_progress.canceled.connect(self.pupils_load_cancelled)
+        QThreadPool.globalInstance().start(self.load_worker)
+
+    def is_current_load(self) -> bool:
+        return self.sender() is self.load_worker.signals
+
+    @Slot()
+    def pupils_load_cancelled(self) -> None:
+        self.load_worker.cancel()
+        self.pupils_model.set_table(self.previous_table)
+        self.ratings_model.set_table(self.previous_table)
+
+    @Slot(tuple)
+    def pupils_subjects_loaded(self, subjects: tuple[str, ...]) -> None:
+        if not self.is_current_load() or self.load_worker.cancelled:
+            return
+        table = PupilsTable([], Ratings(subjects))
+        self.pupils_model.set_table(table)
+        self.ratings_model.set_table(table)
+
+    @Slot(object)
+    def pupils_batch_loaded(self, batch: PupilsTable) -> None:
+        if not self.is_current_load() or self.load_worker.cancelled:
+            return
+        self.pupils_model.begin_append(len(batch.pupils))
+        self.ratings_model.begin_append(len(batch.pupils))
+        self.pupils_model.table.extend(batch)
+        self.pupils_model.end_append()
+        self.ratings_model.end_append()
 
     @Slot(int, int)
-    def cell_index_selected_from_pupils_list(self, y: int, _):
-        self.ui.selected_index.setValue(y+1)
+    def pupils_load_progress(self, loaded: int, total: int) -> None:
+        if not self.is_current_load():
+            return
+        self.load_progress.setMaximum(total)
+        self.load_progress.setValue(loaded)
+
+    @Slot(bool)
+    def pupils_load_finished(self, completed: bool) -> None:
+        if not self.is_current_load():
+            return
+        self.load_progress.reset()
+        self.load_progress.hide()
+        if completed and isinstance(self.load_worker, LoadPupilsWorker):
+            self.save_session()
+
+    @Slot(str)
+    def pupils_load_error(self, message: str) -> None:
+        if not self.is_current_load():
+            return
+        self.load_progress.reset()
+        self.load_progress.hide()
+        self.pupils_model.set_table(self.previous_table)
+        self.ratings_model.set_table(self.previous_table)
+        self.drop_error_message("Не удалось загрузить.", message)
+
+    def save_session(self) -> None:
+        try:
+            self.session.save(self.pupils_model.table)
+        except OSError as e:
+            self.drop_error_message("Не удалось сохранить сессию.", str(e))
+
+    def flush_session(self) -> None:
+        if self.autosave_timer.isActive():
+            self.autosave_timer.stop()
+            self.autosave_session()
+
+    @Slot()
+    def autosave_session(self) -> None:
+        rows, self.session_rows = self.session_rows, set()
+        try:
+            self.session.save_rows(self.pupils_model.table, rows)
+        except OSError as e:
+            self.drop_error_message("Не удалось сохранить сессию.", str(e))
+
+    @Slot(QModelIndex, QModelIndex)
+    def session_rows_changed(self, top_left: QModelIndex, bottom_right: QModelIndex) -> None:
+        self.session_rows.update(range(top_left.row(), bottom_right.row()+1))
+        self.autosave_timer.start()
+
+    @Slot(QModelIndex)
+    def cell_index_selected_from_pupils_list(self, index: QModelIndex):
+        self.ui.selected_index.setValue(index.row()+1)
 
     @Slot(int)
     def cell_index_selected_from_selected_index(self, v: int):
-        if v > self.ui.pupils_list.rowCount():
-            self.ui.selected_index.setValue(self.ui.pupils_list.rowCount())
+        if v > self.pupils_model.rowCount():
+            self.ui.selected_index.setValue(self.pupils_model.rowCount())
         else:
             self.ui.selected_index.setValue(v)
 
     @Slot()
     def generate_diploma(self) -> None:
-        pdf = DiplomaLayout(self)
+        from diploma import DiplomaLayout
+
+        pdf = DiplomaLayout(self.get_diploma_parametrs(), self.get_title_parametrs(), print_supplement=self.get_print_supplement())
         try:
-            pdf.generate_title_list(self.get_pupil_info())
-        except AttributeError:
+            pdf.generate_title_lists([self.get_full_pupil_info()], processes=1)
+        except IndexError:
             self.drop_error_message("Не удалось распечатать.", "В списке нет выпускников, чтобы распечатать аттестат(ы).")
-        pdf.save_file()
+            return
+        file = self.get_output_file()
+        if not file:
+            return
+        pdf.save_file(file)
 
     @Slot()
     def generate_all_diplomas(self) -> None:
-        pdf = DiplomaLayout(self)
-        count = self.ui.pupils_list.rowCount()
+        count = self.pupils_model.rowCount()
         if count == 0:
             self.drop_error_message("Не удалось распечатать.", "В списке нет выпускников, чтобы распечатать аттестат(ы).")
             return
-        for i in range(count):
-            pdf.generate_title_list(self.get_pupil_info(i))
-        pdf.save_file()
+
+        file = self.get_output_file()
+        if not file:
+            return
+
+        pupils = [self.get_full_pupil_info(i) for i in range(count)]
+        self.render_worker = RenderDiplomasWorker(self.get_diploma_parametrs(), self.get_title_parametrs(), pupils, file, self.get_print_supplement())
+        self.render_worker.signals.progress.connect(self.diplomas_render_progress)
+        self.render_worker.signals.finished.connect(self.diplomas_render_finished)
+        self.render_worker.signals.cancelled.connect(self.diplomas_render_cancelled)
+        self.render_worker.signals.error.connect(self.diplomas_render_error)
+
+        self.render_progress = QProgressDialog("Печать аттестатов...", "Отмена", 0, count, self)
+        self.render_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.render_progress.setMinimumDuration(0)
+        self.render_progress.setAutoClose(False)
+        self.render_progress.canceled.connect(self.render_worker.cancel)
+        QThreadPool.globalInstance().start(self.render_worker)
+
+    @Slot(int, int)
+    def diplomas_render_progress(self, rendered: int, total: int) -> None:
+        self.render_progress.setMaximum(total)
+        self.render_progress.setValue(rendered)
+
+    @Slot(str)
+    def diplomas_render_finished(self, file: str) -> None:
+        self.render_progress.reset()
+        self.render_progress.hide()
+        QMessageBox.information(self, "Печать завершена.", f"Аттестаты сохранены в файл {path.abspath(file)}.")
+
+    @Slot()
+    def diplomas_render_cancelled(self) -> None:
+        self.render_progress.reset()
+        self.render_progress.hide()
+
+    @Slot(str)
+    def diplomas_render_error(self, message: str) -> None:
+        self.render_progress.reset()
+        self.render_progress.hide()
+        self.drop_error_message("Не удалось распечатать.", message)
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        self.flush_session()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
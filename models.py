@@ -0,0 +1,114 @@
+from __future__ import annotations
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Slot
+from datetime import datetime
+from datacls import PupilsTable, Ratings
+
+from typing import TYPE_CHECKING, Any
+if TYPE_CHECKING:
+    from PySide6.QtCore import QObject, QPersistentModelIndex
+
+class PupilsTableModel(QAbstractTableModel):
+    def __init__(self, table: PupilsTable | None = None, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.table = table or PupilsTable([], Ratings(tuple()))
+
+    def set_table(self, table: PupilsTable) -> None:
+        self.beginResetModel()
+        self.table = table
+        self.endResetModel()
+
+    def begin_append(self, count: int) -> None:
+        first = len(self.table.pupils)
+        self.beginInsertRows(QModelIndex(), first, first+count-1)
+
+    def end_append(self) -> None:
+        self.endInsertRows()
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.table.pupils)
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+class PupilsModel(PupilsTableModel):
+    headers = ("Фамилия", "Имя", "Отчество", "Дата рождения", "Номер аттестата")
+    fields = ("second_name", "name", "third_name", "birthday", "diploma_id")
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.fields)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        v = getattr(self.table.pupils[index.row()], self.fields[index.column()])
+        if self.fields[index.column()] == "birthday":
+            return v.strftime("%d.%m.%Y")
+        return v
+
+    def setData(self, index: QModelIndex | QPersistentModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        field = self.fields[index.column()]
+        if field == "birthday":
+            try:
+                value = datetime.strptime(value, "%d.%m.%Y").date()
+            except ValueError:
+                return False
+        setattr(self.table.pupils[index.row()], field, value)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return section+1
+
+class RatingsModel(PupilsTableModel):
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.table.subjects)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        rate = self.table.ratings.get(index.row(), self.table.subjects[index.column()])
+        if rate is None:
+            return ""
+        return str(rate)
+
+    def setData(self, index: QModelIndex | QPersistentModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        value = str(value).strip()
+        if value:
+            try:
+                value = int(value)
+            except ValueError:
+                return False
+            if not 0 <= value <= self.table.ratings.MAX_VALUE:
+                return False
+        else:
+            value = None
+        self.table.ratings.set(index.row(), self.table.subjects[index.column()], value)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.table.subjects[section]
+        pupil = self.table.pupils[section]
+        return f"{pupil.second_name} {pupil.name} {pupil.third_name}"
+
+    @Slot(QModelIndex, QModelIndex)
+    def pupils_changed(self, top_left: QModelIndex, bottom_right: QModelIndex) -> None:
+        if top_left.column() <= 2:
+            self.headerDataChanged.emit(Qt.Orientation.Vertical, top_left.row(), bottom_right.row())
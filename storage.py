@@ -0,0 +1,306 @@
+from __future__ import annotations
+from array import array
+from datetime import date
+from hashlib import sha256
+from itertools import accumulate, chain
+from mmap import mmap, ACCESS_READ
+from os import path, makedirs, replace, remove, stat, utime, listdir, fsync
+from time import time
+from uuid import uuid4
+import json
+import struct
+import sys
+from datacls import PupilInformation, PupilsTable, Ratings
+from file_parsing import open_parser
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+TABLE_MAGIC = b"DPT2"
+TABLE_MAGIC_V1 = b"DPT1"
+TABLE_HEADER = struct.Struct("<4sIII")
+TABLE_INDEX = struct.Struct("<i")
+TABLE_STRINGS = struct.Struct("<II")
+TABLE_FIELDS = ("second_name", "name", "third_name", "diploma_id")
+
+def write_file_atomic(file: str, data: bytes | bytearray) -> None:
+    directory = path.dirname(file)
+    if directory and not path.isdir(directory):
+        makedirs(directory)
+    temp = f"{file}.{uuid4().hex}.tmp"
+    f = open(temp, "xb")
+    try:
+        with f:
+            f.write(data)
+            f.flush()
+            fsync(f.fileno())
+        replace(temp, file)
+    except BaseException:
+        remove(temp)
+        raise
+
+def evict_files(directory: str, extension: str, max_size: int, max_age: float) -> None:
+    now = time()
+    entries: list[tuple[float, int, str]] = []
+    for name in listdir(directory):
+        if not name.endswith(extension):
+            continue
+        entry = path.join(directory, name)
+        st = stat(entry)
+        if now-st.st_mtime > max_age:
+            remove(entry)
+        else:
+            entries.append((st.st_mtime, st.st_size, entry))
+
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in entries:
+        if total <= max_size:
+            break
+        remove(entry)
+        total -= size
+
+def make_array(typecode: str, values: Iterable[int]) -> array[int]:
+    a = array(typecode, values)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a
+
+def read_array(typecode: str, data: bytes | memoryview, offset: int, count: int) -> array[int]:
+    a = array(typecode)
+    a.frombytes(data[offset:offset+count*a.itemsize])
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a
+
+def encode_strings(strings: Iterable[str]) -> bytes:
+    strings = list(strings)
+    text = "".join(strings).encode()
+    lengths = make_array("I", (len(s) for s in strings))
+    return b"".join((TABLE_STRINGS.pack(len(strings), len(text)), lengths.tobytes(), text))
+
+def decode_strings(data: bytes) -> list[str]:
+    strings: list[str] = []
+    offset = 0
+    while offset < len(data):
+        if len(data)-offset < TABLE_STRINGS.size:
+            raise ValueError("Файл таблицы выпускников повреждён.")
+        count, size = TABLE_STRINGS.unpack_from(data, offset)
+        offset += TABLE_STRINGS.size
+        lengths = read_array("I", data, offset, count)
+        offset += count*lengths.itemsize
+        if len(lengths) != count or len(data)-offset < size:
+            raise ValueError("Файл таблицы выпускников повреждён.")
+        text = str(data[offset:offset+size], "utf-8")
+        offset += size
+        ends = list(accumulate(lengths))
+        if ends and ends[-1] != len(text):
+            raise ValueError("Файл таблицы выпускников повреждён.")
+        strings.extend(text[start:end] for start, end in zip(chain((0,), ends), ends))
+    return strings
+
+def encode_table(table: PupilsTable) -> tuple[bytes, dict[str, int]]:
+    strings: dict[str, int] = {}
+
+    def get_index(s: str | None) -> int:
+        if s is None:
+            return -1
+        s = str(s)
+        i = strings.get(s)
+        if i is None:
+            i = strings[s] = len(strings)
+        return i
+
+    pupils = table.pupils
+    subjects = make_array("i", (get_index(s) for s in table.subjects))
+    columns = [make_array("i", (get_index(getattr(p, field)) for p in pupils)) for field in TABLE_FIELDS]
+    birthdays = make_array("i", (p.birthday.toordinal() for p in pupils))
+    blob = encode_strings(strings)
+    header = TABLE_HEADER.pack(TABLE_MAGIC, len(pupils), len(subjects), len(blob))
+    data = b"".join((header, subjects.tobytes(), *(c.tobytes() for c in columns), birthdays.tobytes(), table.ratings.values.tobytes(), blob))
+    return data, strings
+
+def dump_table(table: PupilsTable) -> bytes:
+    return encode_table(table)[0]
+
+def read_table(data: bytes | memoryview | mmap) -> tuple[PupilsTable, list[str]]:
+    magic, count, subjects_count, blob_size = TABLE_HEADER.unpack_from(data)
+    if magic not in (TABLE_MAGIC, TABLE_MAGIC_V1):
+        raise ValueError("Неизвестный формат файла таблицы выпускников.")
+    offset = TABLE_HEADER.size
+    subjects = read_array("i", data, offset, subjects_count)
+    offset += subjects_count*subjects.itemsize
+    columns = []
+    for _ in range(len(TABLE_FIELDS)+1):
+        columns.append(read_array("i", data, offset, count))
+        offset += count*columns[-1].itemsize
+    values = read_array("b", data, offset, count*subjects_count)
+    offset += len(values)
+    if len(data)-offset < blob_size:
+        raise ValueError("Файл таблицы выпускников повреждён.")
+
+    blob = bytes(data[offset:offset+blob_size])
+    if magic == TABLE_MAGIC_V1:
+        strings: list[str | None] = str(blob, "utf-8").split("\0")[1:]
+    else:
+        strings = decode_strings(blob) # type: ignore
+    strings.append(None)
+    second_names, names, third_names, diploma_ids, birthdays = columns
+    ratings = Ratings(tuple(strings[i] for i in subjects)) # type: ignore
+    ratings.values = values
+    pupils = [
+        PupilInformation(strings[s], strings[n], strings[t], date.fromordinal(b), strings[d]) # type: ignore
+        for s, n, t, d, b in zip(second_names, names, third_names, diploma_ids, birthdays)
+    ]
+    return PupilsTable(pupils, ratings), strings[:-1] # type: ignore
+
+def load_table(data: bytes | memoryview | mmap) -> PupilsTable:
+    return read_table(data)[0]
+
+def get_table_layout(count: int, subjects_count: int) -> tuple[list[int], int, int]:
+    offset = TABLE_HEADER.size+subjects_count*4
+    columns = [offset+i*count*4 for i in range(len(TABLE_FIELDS)+1)]
+    ratings = offset+len(columns)*count*4
+    return columns, ratings, ratings+count*subjects_count
+
+class SessionFile:
+    def __init__(self, file: str) -> None:
+        self.file = file
+        self.strings: dict[str, int] = {}
+        self.count = -1
+        self.subjects_count = 0
+        self.blob_size = 0
+
+    def load(self) -> PupilsTable | None:
+        try:
+            f = open(self.file, "rb")
+        except FileNotFoundError:
+            return None
+        with f, mmap(f.fileno(), 0, access=ACCESS_READ) as data:
+            table, strings = read_table(data)
+            magic, _, _, self.blob_size = TABLE_HEADER.unpack_from(data)
+        self.strings = {s: i for i, s in enumerate(strings)}
+        self.count = len(table.pupils) if magic == TABLE_MAGIC else -1
+        self.subjects_count = len(table.subjects)
+        return table
+
+    def save(self, table: PupilsTable) -> None:
+        data, self.strings = encode_table(table)
+        write_file_atomic(self.file, data)
+        self.count = len(table.pupils)
+        self.subjects_count = len(table.subjects)
+        self.blob_size = len(data)-get_table_layout(self.count, self.subjects_count)[2]
+
+    def get_index(self, s: str | None, added: list[str]) -> int:
+        if s is None:
+            return -1
+        s = str(s)
+        i = self.strings.get(s)
+        if i is None:
+            i = self.strings[s] = len(self.strings)
+            added.append(s)
+        return i
+
+    def save_rows(self, table: PupilsTable, rows: Iterable[int]) -> None:
+        if len(table.pupils) != self.count or len(table.subjects) != self.subjects_count or not path.isfile(self.file):
+            self.save(table)
+            return
+
+        columns, ratings, blob = get_table_layout(self.count, self.subjects_count)
+        added: list[str] = []
+        writes: list[tuple[int, bytes]] = []
+        for row in sorted(set(rows)):
+            p = table.pupils[row]
+            for offset, field in zip(columns, TABLE_FIELDS):
+                writes.append((offset+row*4, TABLE_INDEX.pack(self.get_index(getattr(p, field), added))))
+            writes.append((columns[-1]+row*4, TABLE_INDEX.pack(p.birthday.toordinal())))
+            writes.append((ratings+row*self.subjects_count, table.ratings.row(row).tobytes()))
+
+        with open(self.file, "r+b") as f:
+            if added:
+                data = encode_strings(added)
+                f.seek(blob+self.blob_size)
+                f.write(data)
+                f.truncate()
+                self.blob_size += len(data)
+                f.seek(0)
+                f.write(TABLE_HEADER.pack(TABLE_MAGIC, self.count, self.subjects_count, self.blob_size))
+            for offset, data in writes:
+                f.seek(offset)
+                f.write(data)
+
+class ParsedCache:
+    def __init__(self, directory: str, max_size: int = 256 << 20, max_age: float = 30*24*3600) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+        self.index_file = path.join(directory, "index.json")
+        makedirs(directory, exist_ok=True)
+
+    def load_index(self) -> dict[str, list]:
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def get_key(self, file: str) -> str:
+        st = stat(file)
+        name = path.abspath(file)
+        index = self.load_index()
+        entry = index.get(name)
+        if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+
+        digest = sha256()
+        with open(file, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        key = digest.hexdigest()
+        index[name] = [st.st_size, st.st_mtime_ns, key]
+        write_file_atomic(self.index_file, json.dumps(index, ensure_ascii=False).encode())
+        return key
+
+    def get_path(self, key: str) -> str:
+        return path.join(self.directory, key+".bin")
+
+    def get(self, file: str) -> PupilsTable | None:
+        entry = self.get_path(self.get_key(file))
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            table = load_table(data)
+        except (ValueError, IndexError, struct.error):
+            remove(entry)
+            return None
+        utime(entry)
+        return table
+
+    def parse(self, file: str) -> PupilsTable:
+        table = self.get(file)
+        if table is None:
+            parser = open_parser(file)
+            try:
+                table = parser.parse()
+            finally:
+                parser.close()
+            self.put(file, table)
+        return table
+
+    def put(self, file: str, table: PupilsTable) -> None:
+        write_file_atomic(self.get_path(self.get_key(file)), dump_table(table))
+        self.evict()
+
+    def evict(self) -> None:
+        evict_files(self.directory, ".bin", self.max_size, self.max_age)
+        self.prune_index()
+
+    def prune_index(self) -> None:
+        index = self.load_index()
+        pruned = {name: entry for name, entry in index.items() if path.isfile(self.get_path(entry[2]))}
+        if len(pruned) != len(index):
+            write_file_atomic(self.index_file, json.dumps(pruned, ensure_ascii=False).encode())
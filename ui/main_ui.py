@@ -16,12 +16,12 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QAbstractItemView, QAbstractScrollArea, QAbstractSpinBox, QApplication,
-    QCheckBox, QComboBox, QDateEdit, QDoubleSpinBox,
-    QFormLayout, QGroupBox, QHBoxLayout, QHeaderView,
-    QLabel, QLayout, QLineEdit, QMainWindow,
-    QPlainTextEdit, QPushButton, QRadioButton, QSizePolicy,
-    QSpacerItem, QSpinBox, QTabWidget, QTableWidget,
-    QTableWidgetItem, QVBoxLayout, QWidget)
+    QCheckBox, QComboBox, QDateEdit, QFormLayout,
+    QGroupBox, QHBoxLayout, QHeaderView, QLabel,
+    QLayout, QLineEdit, QMainWindow, QPlainTextEdit,
+    QPushButton, QRadioButton, QSizePolicy, QSpacerItem,
+    QSpinBox, QTabWidget, QTableView, QVBoxLayout,
+    QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -310,19 +310,7 @@ class Ui_MainWindow(object):
         self.groupBox.setObjectName(u"groupBox")
         self.verticalLayout_6 = QVBoxLayout(self.groupBox)
         self.verticalLayout_6.setObjectName(u"verticalLayout_6")
-        self.pupils_list = QTableWidget(self.groupBox)
-        if (self.pupils_list.columnCount() < 5):
-            self.pupils_list.setColumnCount(5)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.pupils_list.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.pupils_list.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.pupils_list.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.pupils_list.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.pupils_list.setHorizontalHeaderItem(4, __qtablewidgetitem4)
+        self.pupils_list = QTableView(self.groupBox)
         self.pupils_list.setObjectName(u"pupils_list")
         self.pupils_list.setSizeAdjustPolicy(QAbstractScrollArea.AdjustIgnored)
         self.pupils_list.setSelectionMode(QAbstractItemView.SingleSelection)
@@ -473,6 +461,11 @@ class Ui_MainWindow(object):
 
         self.horizontalLayout_6 = QHBoxLayout()
         self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.print_supplement = QCheckBox(self.pupils)
+        self.print_supplement.setObjectName(u"print_supplement")
+
+        self.horizontalLayout_6.addWidget(self.print_supplement)
+
         self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
 
         self.horizontalLayout_6.addItem(self.horizontalSpacer_2)
@@ -503,378 +496,17 @@ class Ui_MainWindow(object):
         self.layout.addTab(self.pupils, "")
         self.layout_params = QWidget()
         self.layout_params.setObjectName(u"layout_params")
-        self.verticalLayout_12 = QVBoxLayout(self.layout_params)
-        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
-        self.groupBox_3 = QGroupBox(self.layout_params)
-        self.groupBox_3.setObjectName(u"groupBox_3")
-        self.verticalLayout_11 = QVBoxLayout(self.groupBox_3)
-        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
-        self.groupBox_4 = QGroupBox(self.groupBox_3)
-        self.groupBox_4.setObjectName(u"groupBox_4")
-        sizePolicy2.setHeightForWidth(self.groupBox_4.sizePolicy().hasHeightForWidth())
-        self.groupBox_4.setSizePolicy(sizePolicy2)
-        self.formLayout_17 = QFormLayout(self.groupBox_4)
-        self.formLayout_17.setObjectName(u"formLayout_17")
-        self.label_6 = QLabel(self.groupBox_4)
-        self.label_6.setObjectName(u"label_6")
-
-        self.formLayout_17.setWidget(0, QFormLayout.LabelRole, self.label_6)
-
-        self.horizontalLayout_15 = QHBoxLayout()
-        self.horizontalLayout_15.setObjectName(u"horizontalLayout_15")
-        self.formLayout_3 = QFormLayout()
-        self.formLayout_3.setObjectName(u"formLayout_3")
-        self.label_4 = QLabel(self.groupBox_4)
-        self.label_4.setObjectName(u"label_4")
-        sizePolicy4.setHeightForWidth(self.label_4.sizePolicy().hasHeightForWidth())
-        self.label_4.setSizePolicy(sizePolicy4)
-
-        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_4)
-
-        self.title_date_x = QDoubleSpinBox(self.groupBox_4)
-        self.title_date_x.setObjectName(u"title_date_x")
-        sizePolicy5.setHeightForWidth(self.title_date_x.sizePolicy().hasHeightForWidth())
-        self.title_date_x.setSizePolicy(sizePolicy5)
-        self.title_date_x.setDecimals(1)
-        self.title_date_x.setMaximum(220.000000000000000)
-
-        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.title_date_x)
-
-
-        self.horizontalLayout_15.addLayout(self.formLayout_3)
-
-        self.formLayout_4 = QFormLayout()
-        self.formLayout_4.setObjectName(u"formLayout_4")
-        self.label_5 = QLabel(self.groupBox_4)
-        self.label_5.setObjectName(u"label_5")
-        sizePolicy6 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Minimum)
-        sizePolicy6.setHorizontalStretch(0)
-        sizePolicy6.setVerticalStretch(0)
-        sizePolicy6.setHeightForWidth(self.label_5.sizePolicy().hasHeightForWidth())
-        self.label_5.setSizePolicy(sizePolicy6)
-
-        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_5)
-
-        self.title_date_y = QDoubleSpinBox(self.groupBox_4)
-        self.title_date_y.setObjectName(u"title_date_y")
-        sizePolicy5.setHeightForWidth(self.title_date_y.sizePolicy().hasHeightForWidth())
-        self.title_date_y.setSizePolicy(sizePolicy5)
-        self.title_date_y.setDecimals(1)
-        self.title_date_y.setMaximum(220.000000000000000)
-
-        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.title_date_y)
-
-
-        self.horizontalLayout_15.addLayout(self.formLayout_4)
-
-
-        self.formLayout_17.setLayout(0, QFormLayout.FieldRole, self.horizontalLayout_15)
-
-        self.label_11 = QLabel(self.groupBox_4)
-        self.label_11.setObjectName(u"label_11")
-
-        self.formLayout_17.setWidget(1, QFormLayout.LabelRole, self.label_11)
-
-        self.horizontalLayout_17 = QHBoxLayout()
-        self.horizontalLayout_17.setObjectName(u"horizontalLayout_17")
-        self.formLayout_7 = QFormLayout()
-        self.formLayout_7.setObjectName(u"formLayout_7")
-        self.label_9 = QLabel(self.groupBox_4)
-        self.label_9.setObjectName(u"label_9")
-        sizePolicy4.setHeightForWidth(self.label_9.sizePolicy().hasHeightForWidth())
-        self.label_9.setSizePolicy(sizePolicy4)
-
-        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_9)
-
-        self.title_year_x = QDoubleSpinBox(self.groupBox_4)
-        self.title_year_x.setObjectName(u"title_year_x")
-        sizePolicy5.setHeightForWidth(self.title_year_x.sizePolicy().hasHeightForWidth())
-        self.title_year_x.setSizePolicy(sizePolicy5)
-        self.title_year_x.setDecimals(1)
-        self.title_year_x.setMaximum(220.000000000000000)
-
-        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.title_year_x)
-
-
-        self.horizontalLayout_17.addLayout(self.formLayout_7)
-
-        self.formLayout_8 = QFormLayout()
-        self.formLayout_8.setObjectName(u"formLayout_8")
-        self.label_10 = QLabel(self.groupBox_4)
-        self.label_10.setObjectName(u"label_10")
-        sizePolicy6.setHeightForWidth(self.label_10.sizePolicy().hasHeightForWidth())
-        self.label_10.setSizePolicy(sizePolicy6)
-
-        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.label_10)
-
-        self.title_year_y = QDoubleSpinBox(self.groupBox_4)
-        self.title_year_y.setObjectName(u"title_year_y")
-        sizePolicy5.setHeightForWidth(self.title_year_y.sizePolicy().hasHeightForWidth())
-        self.title_year_y.setSizePolicy(sizePolicy5)
-        self.title_year_y.setDecimals(1)
-        self.title_year_y.setMaximum(220.000000000000000)
-
-        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.title_year_y)
-
-
-        self.horizontalLayout_17.addLayout(self.formLayout_8)
-
-
-        self.formLayout_17.setLayout(1, QFormLayout.FieldRole, self.horizontalLayout_17)
-
-        self.label_14 = QLabel(self.groupBox_4)
-        self.label_14.setObjectName(u"label_14")
-
-        self.formLayout_17.setWidget(2, QFormLayout.LabelRole, self.label_14)
-
-        self.horizontalLayout_18 = QHBoxLayout()
-        self.horizontalLayout_18.setObjectName(u"horizontalLayout_18")
-        self.formLayout_9 = QFormLayout()
-        self.formLayout_9.setObjectName(u"formLayout_9")
-        self.label_12 = QLabel(self.groupBox_4)
-        self.label_12.setObjectName(u"label_12")
-        sizePolicy4.setHeightForWidth(self.label_12.sizePolicy().hasHeightForWidth())
-        self.label_12.setSizePolicy(sizePolicy4)
-
-        self.formLayout_9.setWidget(0, QFormLayout.LabelRole, self.label_12)
-
-        self.title_school_name_x = QDoubleSpinBox(self.groupBox_4)
-        self.title_school_name_x.setObjectName(u"title_school_name_x")
-        sizePolicy5.setHeightForWidth(self.title_school_name_x.sizePolicy().hasHeightForWidth())
-        self.title_school_name_x.setSizePolicy(sizePolicy5)
-        self.title_school_name_x.setDecimals(1)
-        self.title_school_name_x.setMaximum(220.000000000000000)
-
-        self.formLayout_9.setWidget(0, QFormLayout.FieldRole, self.title_school_name_x)
-
-
-        self.horizontalLayout_18.addLayout(self.formLayout_9)
-
-        self.formLayout_10 = QFormLayout()
-        self.formLayout_10.setObjectName(u"formLayout_10")
-        self.label_13 = QLabel(self.groupBox_4)
-        self.label_13.setObjectName(u"label_13")
-        sizePolicy6.setHeightForWidth(self.label_13.sizePolicy().hasHeightForWidth())
-        self.label_13.setSizePolicy(sizePolicy6)
-
-        self.formLayout_10.setWidget(0, QFormLayout.LabelRole, self.label_13)
-
-        self.title_school_name_y = QDoubleSpinBox(self.groupBox_4)
-        self.title_school_name_y.setObjectName(u"title_school_name_y")
-        sizePolicy5.setHeightForWidth(self.title_school_name_y.sizePolicy().hasHeightForWidth())
-        self.title_school_name_y.setSizePolicy(sizePolicy5)
-        self.title_school_name_y.setDecimals(1)
-        self.title_school_name_y.setMaximum(220.000000000000000)
-
-        self.formLayout_10.setWidget(0, QFormLayout.FieldRole, self.title_school_name_y)
-
-
-        self.horizontalLayout_18.addLayout(self.formLayout_10)
-
-
-        self.formLayout_17.setLayout(2, QFormLayout.FieldRole, self.horizontalLayout_18)
-
-        self.label_17 = QLabel(self.groupBox_4)
-        self.label_17.setObjectName(u"label_17")
-
-        self.formLayout_17.setWidget(3, QFormLayout.LabelRole, self.label_17)
-
-        self.horizontalLayout_19 = QHBoxLayout()
-        self.horizontalLayout_19.setObjectName(u"horizontalLayout_19")
-        self.formLayout_11 = QFormLayout()
-        self.formLayout_11.setObjectName(u"formLayout_11")
-        self.label_15 = QLabel(self.groupBox_4)
-        self.label_15.setObjectName(u"label_15")
-        sizePolicy4.setHeightForWidth(self.label_15.sizePolicy().hasHeightForWidth())
-        self.label_15.setSizePolicy(sizePolicy4)
-
-        self.formLayout_11.setWidget(0, QFormLayout.LabelRole, self.label_15)
-
-        self.title_head_of_edu_FST_x = QDoubleSpinBox(self.groupBox_4)
-        self.title_head_of_edu_FST_x.setObjectName(u"title_head_of_edu_FST_x")
-        sizePolicy5.setHeightForWidth(self.title_head_of_edu_FST_x.sizePolicy().hasHeightForWidth())
-        self.title_head_of_edu_FST_x.setSizePolicy(sizePolicy5)
-        self.title_head_of_edu_FST_x.setDecimals(1)
-        self.title_head_of_edu_FST_x.setMaximum(220.000000000000000)
-
-        self.formLayout_11.setWidget(0, QFormLayout.FieldRole, self.title_head_of_edu_FST_x)
-
-
-        self.horizontalLayout_19.addLayout(self.formLayout_11)
-
-        self.formLayout_12 = QFormLayout()
-        self.formLayout_12.setObjectName(u"formLayout_12")
-        self.label_16 = QLabel(self.groupBox_4)
-        self.label_16.setObjectName(u"label_16")
-        sizePolicy6.setHeightForWidth(self.label_16.sizePolicy().hasHeightForWidth())
-        self.label_16.setSizePolicy(sizePolicy6)
-
-        self.formLayout_12.setWidget(0, QFormLayout.LabelRole, self.label_16)
-
-        self.title_head_of_edu_FST_y = QDoubleSpinBox(self.groupBox_4)
-        self.title_head_of_edu_FST_y.setObjectName(u"title_head_of_edu_FST_y")
-        sizePolicy5.setHeightForWidth(self.title_head_of_edu_FST_y.sizePolicy().hasHeightForWidth())
-        self.title_head_of_edu_FST_y.setSizePolicy(sizePolicy5)
-        self.title_head_of_edu_FST_y.setDecimals(1)
-        self.title_head_of_edu_FST_y.setMaximum(220.000000000000000)
-
-        self.formLayout_12.setWidget(0, QFormLayout.FieldRole, self.title_head_of_edu_FST_y)
-
-
-        self.horizontalLayout_19.addLayout(self.formLayout_12)
-
-
-        self.formLayout_17.setLayout(3, QFormLayout.FieldRole, self.horizontalLayout_19)
-
-        self.label_20 = QLabel(self.groupBox_4)
-        self.label_20.setObjectName(u"label_20")
-
-        self.formLayout_17.setWidget(4, QFormLayout.LabelRole, self.label_20)
-
-        self.horizontalLayout_20 = QHBoxLayout()
-        self.horizontalLayout_20.setObjectName(u"horizontalLayout_20")
-        self.formLayout_13 = QFormLayout()
-        self.formLayout_13.setObjectName(u"formLayout_13")
-        self.label_18 = QLabel(self.groupBox_4)
-        self.label_18.setObjectName(u"label_18")
-        sizePolicy4.setHeightForWidth(self.label_18.sizePolicy().hasHeightForWidth())
-        self.label_18.setSizePolicy(sizePolicy4)
-
-        self.formLayout_13.setWidget(0, QFormLayout.LabelRole, self.label_18)
-
-        self.title_pupil_FST_x = QDoubleSpinBox(self.groupBox_4)
-        self.title_pupil_FST_x.setObjectName(u"title_pupil_FST_x")
-        sizePolicy5.setHeightForWidth(self.title_pupil_FST_x.sizePolicy().hasHeightForWidth())
-        self.title_pupil_FST_x.setSizePolicy(sizePolicy5)
-        self.title_pupil_FST_x.setDecimals(1)
-        self.title_pupil_FST_x.setMaximum(220.000000000000000)
-
-        self.formLayout_13.setWidget(0, QFormLayout.FieldRole, self.title_pupil_FST_x)
-
-
-        self.horizontalLayout_20.addLayout(self.formLayout_13)
-
-        self.formLayout_14 = QFormLayout()
-        self.formLayout_14.setObjectName(u"formLayout_14")
-        self.label_19 = QLabel(self.groupBox_4)
-        self.label_19.setObjectName(u"label_19")
-        sizePolicy6.setHeightForWidth(self.label_19.sizePolicy().hasHeightForWidth())
-        self.label_19.setSizePolicy(sizePolicy6)
-
-        self.formLayout_14.setWidget(0, QFormLayout.LabelRole, self.label_19)
-
-        self.title_pupil_FST_y = QDoubleSpinBox(self.groupBox_4)
-        self.title_pupil_FST_y.setObjectName(u"title_pupil_FST_y")
-        sizePolicy5.setHeightForWidth(self.title_pupil_FST_y.sizePolicy().hasHeightForWidth())
-        self.title_pupil_FST_y.setSizePolicy(sizePolicy5)
-        self.title_pupil_FST_y.setDecimals(1)
-        self.title_pupil_FST_y.setMaximum(220.000000000000000)
-
-        self.formLayout_14.setWidget(0, QFormLayout.FieldRole, self.title_pupil_FST_y)
-
-
-        self.horizontalLayout_20.addLayout(self.formLayout_14)
-
-
-        self.formLayout_17.setLayout(4, QFormLayout.FieldRole, self.horizontalLayout_20)
-
-        self.label_23 = QLabel(self.groupBox_4)
-        self.label_23.setObjectName(u"label_23")
-
-        self.formLayout_17.setWidget(5, QFormLayout.LabelRole, self.label_23)
-
-        self.horizontalLayout_21 = QHBoxLayout()
-        self.horizontalLayout_21.setObjectName(u"horizontalLayout_21")
-        self.formLayout_15 = QFormLayout()
-        self.formLayout_15.setObjectName(u"formLayout_15")
-        self.label_21 = QLabel(self.groupBox_4)
-        self.label_21.setObjectName(u"label_21")
-        sizePolicy4.setHeightForWidth(self.label_21.sizePolicy().hasHeightForWidth())
-        self.label_21.setSizePolicy(sizePolicy4)
-
-        self.formLayout_15.setWidget(0, QFormLayout.LabelRole, self.label_21)
-
-        self.title_qrcode_x = QDoubleSpinBox(self.groupBox_4)
-        self.title_qrcode_x.setObjectName(u"title_qrcode_x")
-        sizePolicy5.setHeightForWidth(self.title_qrcode_x.sizePolicy().hasHeightForWidth())
-        self.title_qrcode_x.setSizePolicy(sizePolicy5)
-        self.title_qrcode_x.setDecimals(1)
-        self.title_qrcode_x.setMaximum(220.000000000000000)
-
-        self.formLayout_15.setWidget(0, QFormLayout.FieldRole, self.title_qrcode_x)
-
-
-        self.horizontalLayout_21.addLayout(self.formLayout_15)
-
-        self.formLayout_16 = QFormLayout()
-        self.formLayout_16.setObjectName(u"formLayout_16")
-        self.label_22 = QLabel(self.groupBox_4)
-        self.label_22.setObjectName(u"label_22")
-        sizePolicy6.setHeightForWidth(self.label_22.sizePolicy().hasHeightForWidth())
-        self.label_22.setSizePolicy(sizePolicy6)
-
-        self.formLayout_16.setWidget(0, QFormLayout.LabelRole, self.label_22)
-
-        self.title_qrcode_y = QDoubleSpinBox(self.groupBox_4)
-        self.title_qrcode_y.setObjectName(u"title_qrcode_y")
-        sizePolicy5.setHeightForWidth(self.title_qrcode_y.sizePolicy().hasHeightForWidth())
-        self.title_qrcode_y.setSizePolicy(sizePolicy5)
-        self.title_qrcode_y.setDecimals(1)
-        self.title_qrcode_y.setMaximum(220.000000000000000)
-
-        self.formLayout_16.setWidget(0, QFormLayout.FieldRole, self.title_qrcode_y)
-
-
-        self.horizontalLayout_21.addLayout(self.formLayout_16)
-
-
-        self.formLayout_17.setLayout(5, QFormLayout.FieldRole, self.horizontalLayout_21)
-
-
-        self.verticalLayout_11.addWidget(self.groupBox_4)
-
-        self.title_image = QCheckBox(self.groupBox_3)
-        self.title_image.setObjectName(u"title_image")
-
-        self.verticalLayout_11.addWidget(self.title_image)
-
-
-        self.verticalLayout_12.addWidget(self.groupBox_3)
-
-        self.verticalSpacer_8 = QSpacerItem(20, 207, QSizePolicy.Minimum, QSizePolicy.Expanding)
-
-        self.verticalLayout_12.addItem(self.verticalSpacer_8)
-
-        self.horizontalLayout_22 = QHBoxLayout()
-        self.horizontalLayout_22.setObjectName(u"horizontalLayout_22")
-        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
-
-        self.horizontalLayout_22.addItem(self.horizontalSpacer_5)
-
-        self.reset_title_settings = QPushButton(self.layout_params)
-        self.reset_title_settings.setObjectName(u"reset_title_settings")
-
-        self.horizontalLayout_22.addWidget(self.reset_title_settings)
-
-        self.save_title_settings = QPushButton(self.layout_params)
-        self.save_title_settings.setObjectName(u"save_title_settings")
-
-        self.horizontalLayout_22.addWidget(self.save_title_settings)
-
-
-        self.verticalLayout_12.addLayout(self.horizontalLayout_22)
-
         self.layout.addTab(self.layout_params, "")
 
         self.horizontalLayout_8.addWidget(self.layout)
 
-        self.rating_list = QTableWidget(self.centralwidget)
+        self.rating_list = QTableView(self.centralwidget)
         self.rating_list.setObjectName(u"rating_list")
-        sizePolicy7 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        sizePolicy7.setHorizontalStretch(0)
-        sizePolicy7.setVerticalStretch(0)
-        sizePolicy7.setHeightForWidth(self.rating_list.sizePolicy().hasHeightForWidth())
-        self.rating_list.setSizePolicy(sizePolicy7)
+        sizePolicy6 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        sizePolicy6.setHorizontalStretch(0)
+        sizePolicy6.setVerticalStretch(0)
+        sizePolicy6.setHeightForWidth(self.rating_list.sizePolicy().hasHeightForWidth())
+        self.rating_list.setSizePolicy(sizePolicy6)
         self.rating_list.setSizeAdjustPolicy(QAbstractScrollArea.AdjustIgnored)
         self.rating_list.setSelectionMode(QAbstractItemView.SingleSelection)
         self.rating_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
@@ -946,16 +578,6 @@ class Ui_MainWindow(object):
         self.save_diploma_settings.setText(QCoreApplication.translate("MainWindow", u"\u0421\u043e\u0445\u0440\u0430\u043d\u0438\u0442\u044c", None))
         self.layout.setTabText(self.layout.indexOf(self.diploma_settings), QCoreApplication.translate("MainWindow", u"\u041d\u0430\u0441\u0442\u0440\u043e\u0439\u043a\u0438 \u0430\u0442\u0442\u0435\u0441\u0442\u0430\u0442\u0430", None))
         self.groupBox.setTitle(QCoreApplication.translate("MainWindow", u"\u0421\u043f\u0438\u0441\u043e\u043a \u0443\u0447\u0435\u043d\u0438\u043a\u043e\u0432", None))
-        ___qtablewidgetitem = self.pupils_list.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"\u0424\u0430\u043c\u0438\u043b\u0438\u044f", None));
-        ___qtablewidgetitem1 = self.pupils_list.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"\u0418\u043c\u044f", None));
-        ___qtablewidgetitem2 = self.pupils_list.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"\u041e\u0442\u0447\u0435\u0441\u0442\u0432\u043e", None));
-        ___qtablewidgetitem3 = self.pupils_list.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"\u0414\u0430\u0442\u0430 \u0440\u043e\u0436\u0434\u0435\u043d\u0438\u044f", None));
-        ___qtablewidgetitem4 = self.pupils_list.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"\u041d\u043e\u043c\u0435\u0440 \u0430\u0442\u0442\u0435\u0441\u0442\u0430\u0442\u0430", None));
         self.delete_pupil.setText(QCoreApplication.translate("MainWindow", u"\u0423\u0434\u0430\u043b\u0438\u0442\u044c", None))
         self.create_pupil.setText(QCoreApplication.translate("MainWindow", u"\u0421\u043e\u0437\u0434\u0430\u0442\u044c", None))
         self.groupBox_2.setTitle(QCoreApplication.translate("MainWindow", u"\u0414\u043e\u043f\u043e\u043b\u043d\u0438\u0442\u0435\u043b\u044c\u043d\u044b\u0435 \u043f\u0430\u0440\u0430\u043c\u0435\u0442\u0440\u044b", None))
@@ -967,34 +589,12 @@ class Ui_MainWindow(object):
         self.lineEdit.setInputMask("")
         self.lineEdit.setPlaceholderText(QCoreApplication.translate("MainWindow", u"\u0410-\u042f", None))
         self.label_3.setText(QCoreApplication.translate("MainWindow", u"\u0412\u044b\u0431\u0440\u0430\u043d\u043d\u044b\u0439 \u043d\u043e\u043c\u0435\u0440", None))
+        self.print_supplement.setText(QCoreApplication.translate("MainWindow", u"\u041f\u0440\u0438\u043b\u043e\u0436\u0435\u043d\u0438\u0435 \u0441 \u043e\u0446\u0435\u043d\u043a\u0430\u043c\u0438", None))
         self.generate_all_diplomas.setText(QCoreApplication.translate("MainWindow", u"\u0420\u0430\u0441\u043f\u0435\u0447\u0430\u0442\u0430\u0442\u044c \u0432\u0441\u0435\u043c", None))
         self.generate_diploma.setText(QCoreApplication.translate("MainWindow", u"\u0420\u0430\u0441\u043f\u0435\u0447\u0430\u0442\u0430\u0442\u044c", None))
         self.clear_pupils.setText(QCoreApplication.translate("MainWindow", u"\u041e\u0447\u0438\u0441\u0442\u0438\u0442\u044c", None))
         self.load_pupils.setText(QCoreApplication.translate("MainWindow", u"\u0417\u0430\u0433\u0440\u0443\u0437\u0438\u0442\u044c", None))
         self.layout.setTabText(self.layout.indexOf(self.pupils), QCoreApplication.translate("MainWindow", u"\u0423\u0447\u0435\u043d\u0438\u043a\u0438", None))
-        self.groupBox_3.setTitle(QCoreApplication.translate("MainWindow", u"\u0422\u0438\u0442\u0443\u043b\u044c\u043d\u0438\u043a", None))
-        self.groupBox_4.setTitle(QCoreApplication.translate("MainWindow", u"\u0420\u0430\u0437\u043c\u0435\u0449\u0435\u043d\u0438\u0435", None))
-        self.label_6.setText(QCoreApplication.translate("MainWindow", u"\u0414\u0430\u0442\u0430 \u0432\u044b\u0434\u0430\u0447\u0438", None))
-        self.label_4.setText(QCoreApplication.translate("MainWindow", u"X:", None))
-        self.label_5.setText(QCoreApplication.translate("MainWindow", u"Y:", None))
-        self.label_11.setText(QCoreApplication.translate("MainWindow", u"\u0413\u043e\u0434 \u0432\u044b\u0434\u0430\u0447\u0438", None))
-        self.label_9.setText(QCoreApplication.translate("MainWindow", u"X:", None))
-        self.label_10.setText(QCoreApplication.translate("MainWindow", u"Y:", None))
-        self.label_14.setText(QCoreApplication.translate("MainWindow", u"\u041d\u0430\u0437\u0432\u0430\u043d\u0438\u0435 \u0448\u043a\u043e\u043b\u044b", None))
-        self.label_12.setText(QCoreApplication.translate("MainWindow", u"X:", None))
-        self.label_13.setText(QCoreApplication.translate("MainWindow", u"Y:", None))
-        self.label_17.setText(QCoreApplication.translate("MainWindow", u"\u0424\u0418\u041e \u0440\u0443\u043a\u043e\u0432\u0430\u0434\u0438\u0442\u0435\u043b\u044f", None))
-        self.label_15.setText(QCoreApplication.translate("MainWindow", u"X:", None))
-        self.label_16.setText(QCoreApplication.translate("MainWindow", u"Y:", None))
-        self.label_20.setText(QCoreApplication.translate("MainWindow", u"\u0424\u0418\u041e \u0443\u0447\u0435\u043d\u0438\u043a\u0430", None))
-        self.label_18.setText(QCoreApplication.translate("MainWindow", u"X:", None))
-        self.label_19.setText(QCoreApplication.translate("MainWindow", u"Y:", None))
-        self.label_23.setText(QCoreApplication.translate("MainWindow", u"QR-\u043a\u043e\u0434", None))
-        self.label_21.setText(QCoreApplication.translate("MainWindow", u"X:", None))
-        self.label_22.setText(QCoreApplication.translate("MainWindow", u"Y:", None))
-        self.title_image.setText(QCoreApplication.translate("MainWindow", u"\u041f\u0435\u0447\u0430\u0442\u0430\u0442\u044c \u0438\u0437\u043e\u0431\u0440\u0430\u0436\u0435\u043d\u0438\u0435 \u0442\u0438\u0442\u0443\u043b\u044c\u043d\u0438\u043a\u0430", None))
-        self.reset_title_settings.setText(QCoreApplication.translate("MainWindow", u"\u0421\u0431\u0440\u043e\u0441\u0438\u0442\u044c", None))
-        self.save_title_settings.setText(QCoreApplication.translate("MainWindow", u"\u0421\u043e\u0445\u0440\u0430\u043d\u0438\u0442\u044c", None))
         self.layout.setTabText(self.layout.indexOf(self.layout_params), QCoreApplication.translate("MainWindow", u"\u041c\u0430\u043a\u0435\u0442\u044b", None))
     # retranslateUi
 
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'title_layout.ui'
+##
+## Created by: Qt User Interface Compiler version 6.6.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDoubleSpinBox, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_TitleLayout(object):
+    def setupUi(self, TitleLayout):
+        if not TitleLayout.objectName():
+            TitleLayout.setObjectName(u"TitleLayout")
+        self.verticalLayout_12 = QVBoxLayout(TitleLayout)
+        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
+        self.groupBox_3 = QGroupBox(TitleLayout)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.verticalLayout_11 = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.groupBox_4 = QGroupBox(self.groupBox_3)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groupBox_4.sizePolicy().hasHeightForWidth())
+        self.groupBox_4.setSizePolicy(sizePolicy)
+        self.formLayout_17 = QFormLayout(self.groupBox_4)
+        self.formLayout_17.setObjectName(u"formLayout_17")
+        self.label_6 = QLabel(self.groupBox_4)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_17.setWidget(0, QFormLayout.LabelRole, self.label_6)
+
+        self.horizontalLayout_15 = QHBoxLayout()
+        self.horizontalLayout_15.setObjectName(u"horizontalLayout_15")
+        self.formLayout_3 = QFormLayout()
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_4 = QLabel(self.groupBox_4)
+        self.label_4.setObjectName(u"label_4")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.label_4.sizePolicy().hasHeightForWidth())
+        self.label_4.setSizePolicy(sizePolicy1)
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.title_date_x = QDoubleSpinBox(self.groupBox_4)
+        self.title_date_x.setObjectName(u"title_date_x")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.title_date_x.sizePolicy().hasHeightForWidth())
+        self.title_date_x.setSizePolicy(sizePolicy2)
+        self.title_date_x.setDecimals(1)
+        self.title_date_x.setMaximum(220.000000000000000)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.title_date_x)
+
+
+        self.horizontalLayout_15.addLayout(self.formLayout_3)
+
+        self.formLayout_4 = QFormLayout()
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_5 = QLabel(self.groupBox_4)
+        self.label_5.setObjectName(u"label_5")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Minimum)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.label_5.sizePolicy().hasHeightForWidth())
+        self.label_5.setSizePolicy(sizePolicy3)
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.title_date_y = QDoubleSpinBox(self.groupBox_4)
+        self.title_date_y.setObjectName(u"title_date_y")
+        sizePolicy2.setHeightForWidth(self.title_date_y.sizePolicy().hasHeightForWidth())
+        self.title_date_y.setSizePolicy(sizePolicy2)
+        self.title_date_y.setDecimals(1)
+        self.title_date_y.setMaximum(220.000000000000000)
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.title_date_y)
+
+
+        self.horizontalLayout_15.addLayout(self.formLayout_4)
+
+
+        self.formLayout_17.setLayout(0, QFormLayout.FieldRole, self.horizontalLayout_15)
+
+        self.label_11 = QLabel(self.groupBox_4)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_17.setWidget(1, QFormLayout.LabelRole, self.label_11)
+
+        self.horizontalLayout_17 = QHBoxLayout()
+        self.horizontalLayout_17.setObjectName(u"horizontalLayout_17")
+        self.formLayout_7 = QFormLayout()
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.label_9 = QLabel(self.groupBox_4)
+        self.label_9.setObjectName(u"label_9")
+        sizePolicy1.setHeightForWidth(self.label_9.sizePolicy().hasHeightForWidth())
+        self.label_9.setSizePolicy(sizePolicy1)
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.title_year_x = QDoubleSpinBox(self.groupBox_4)
+        self.title_year_x.setObjectName(u"title_year_x")
+        sizePolicy2.setHeightForWidth(self.title_year_x.sizePolicy().hasHeightForWidth())
+        self.title_year_x.setSizePolicy(sizePolicy2)
+        self.title_year_x.setDecimals(1)
+        self.title_year_x.setMaximum(220.000000000000000)
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.title_year_x)
+
+
+        self.horizontalLayout_17.addLayout(self.formLayout_7)
+
+        self.formLayout_8 = QFormLayout()
+        self.formLayout_8.setObjectName(u"formLayout_8")
+        self.label_10 = QLabel(self.groupBox_4)
+        self.label_10.setObjectName(u"label_10")
+        sizePolicy3.setHeightForWidth(self.label_10.sizePolicy().hasHeightForWidth())
+        self.label_10.setSizePolicy(sizePolicy3)
+
+        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.label_10)
+
+        self.title_year_y = QDoubleSpinBox(self.groupBox_4)
+        self.title_year_y.setObjectName(u"title_year_y")
+        sizePolicy2.setHeightForWidth(self.title_year_y.sizePolicy().hasHeightForWidth())
+        self.title_year_y.setSizePolicy(sizePolicy2)
+        self.title_year_y.setDecimals(1)
+        self.title_year_y.setMaximum(220.000000000000000)
+
+        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.title_year_y)
+
+
+        self.horizontalLayout_17.addLayout(self.formLayout_8)
+
+
+        self.formLayout_17.setLayout(1, QFormLayout.FieldRole, self.horizontalLayout_17)
+
+        self.label_14 = QLabel(self.groupBox_4)
+        self.label_14.setObjectName(u"label_14")
+
+        self.formLayout_17.setWidget(2, QFormLayout.LabelRole, self.label_14)
+
+        self.horizontalLayout_18 = QHBoxLayout()
+        self.horizontalLayout_18.setObjectName(u"horizontalLayout_18")
+        self.formLayout_9 = QFormLayout()
+        self.formLayout_9.setObjectName(u"formLayout_9")
+        self.label_12 = QLabel(self.groupBox_4)
+        self.label_12.setObjectName(u"label_12")
+        sizePolicy1.setHeightForWidth(self.label_12.sizePolicy().hasHeightForWidth())
+        self.label_12.setSizePolicy(sizePolicy1)
+
+        self.formLayout_9.setWidget(0, QFormLayout.LabelRole, self.label_12)
+
+        self.title_school_name_x = QDoubleSpinBox(self.groupBox_4)
+        self.title_school_name_x.setObjectName(u"title_school_name_x")
+        sizePolicy2.setHeightForWidth(self.title_school_name_x.sizePolicy().hasHeightForWidth())
+        self.title_school_name_x.setSizePolicy(sizePolicy2)
+        self.title_school_name_x.setDecimals(1)
+        self.title_school_name_x.setMaximum(220.000000000000000)
+
+        self.formLayout_9.setWidget(0, QFormLayout.FieldRole, self.title_school_name_x)
+
+
+        self.horizontalLayout_18.addLayout(self.formLayout_9)
+
+        self.formLayout_10 = QFormLayout()
+        self.formLayout_10.setObjectName(u"formLayout_10")
+        self.label_13 = QLabel(self.groupBox_4)
+        self.label_13.setObjectName(u"label_13")
+        sizePolicy3.setHeightForWidth(self.label_13.sizePolicy().hasHeightForWidth())
+        self.label_13.setSizePolicy(sizePolicy3)
+
+        self.formLayout_10.setWidget(0, QFormLayout.LabelRole, self.label_13)
+
+        self.title_school_name_y = QDoubleSpinBox(self.groupBox_4)
+        self.title_school_name_y.setObjectName(u"title_school_name_y")
+        sizePolicy2.setHeightForWidth(self.title_school_name_y.sizePolicy().hasHeightForWidth())
+        self.title_school_name_y.setSizePolicy(sizePolicy2)
+        self.title_school_name_y.setDecimals(1)
+        self.title_school_name_y.setMaximum(220.000000000000000)
+
+        self.formLayout_10.setWidget(0, QFormLayout.FieldRole, self.title_school_name_y)
+
+
+        self.horizontalLayout_18.addLayout(self.formLayout_10)
+
+
+        self.formLayout_17.setLayout(2, QFormLayout.FieldRole, self.horizontalLayout_18)
+
+        self.label_17 = QLabel(self.groupBox_4)
+        self.label_17.setObjectName(u"label_17")
+
+        self.formLayout_17.setWidget(3, QFormLayout.LabelRole, self.label_17)
+
+        self.horizontalLayout_19 = QHBoxLayout()
+        self.horizontalLayout_19.setObjectName(u"horizontalLayout_19")
+        self.formLayout_11 = QFormLayout()
+        self.formLayout_11.setObjectName(u"formLayout_11")
+        self.label_15 = QLabel(self.groupBox_4)
+        self.label_15.setObjectName(u"label_15")
+        sizePolicy1.setHeightForWidth(self.label_15.sizePolicy().hasHeightForWidth())
+        self.label_15.setSizePolicy(sizePolicy1)
+
+        self.formLayout_11.setWidget(0, QFormLayout.LabelRole, self.label_15)
+
+        self.title_head_of_edu_FST_x = QDoubleSpinBox(self.groupBox_4)
+        self.title_head_of_edu_FST_x.setObjectName(u"title_head_of_edu_FST_x")
+        sizePolicy2.setHeightForWidth(self.title_head_of_edu_FST_x.sizePolicy().hasHeightForWidth())
+        self.title_head_of_edu_FST_x.setSizePolicy(sizePolicy2)
+        self.title_head_of_edu_FST_x.setDecimals(1)
+        self.title_head_of_edu_FST_x.setMaximum(220.000000000000000)
+
+        self.formLayout_11.setWidget(0, QFormLayout.FieldRole, self.title_head_of_edu_FST_x)
+
+
+        self.horizontalLayout_19.addLayout(self.formLayout_11)
+
+        self.formLayout_12 = QFormLayout()
+        self.formLayout_12.setObjectName(u"formLayout_12")
+        self.label_16 = QLabel(self.groupBox_4)
+        self.label_16.setObjectName(u"label_16")
+        sizePolicy3.setHeightForWidth(self.label_16.sizePolicy().hasHeightForWidth())
+        self.label_16.setSizePolicy(sizePolicy3)
+
+        self.formLayout_12.setWidget(0, QFormLayout.LabelRole, self.label_16)
+
+        self.title_head_of_edu_FST_y = QDoubleSpinBox(self.groupBox_4)
+        self.title_head_of_edu_FST_y.setObjectName(u"title_head_of_edu_FST_y")
+        sizePolicy2.setHeightForWidth(self.title_head_of_edu_FST_y.sizePolicy().hasHeightForWidth())
+        self.title_head_of_edu_FST_y.setSizePolicy(sizePolicy2)
+        self.title_head_of_edu_FST_y.setDecimals(1)
+        self.title_head_of_edu_FST_y.setMaximum(220.000000000000000)
+
+        self.formLayout_12.setWidget(0, QFormLayout.FieldRole, self.title_head_of_edu_FST_y)
+
+
+        self.horizontalLayout_19.addLayout(self.formLayout_12)
+
+
+        self.formLayout_17.setLayout(3, QFormLayout.FieldRole, self.horizontalLayout_19)
+
+        self.label_20 = QLabel(self.groupBox_4)
+        self.label_20.setObjectName(u"label_20")
+
+        self.formLayout_17.setWidget(4, QFormLayout.LabelRole, self.label_20)
+
+        self.horizontalLayout_20 = QHBoxLayout()
+        self.horizontalLayout_20.setObjectName(u"horizontalLayout_20")
+        self.formLayout_13 = QFormLayout()
+        self.formLayout_13.setObjectName(u"formLayout_13")
+        self.label_18 = QLabel(self.groupBox_4)
+        self.label_18.setObjectName(u"label_18")
+        sizePolicy1.setHeightForWidth(self.label_18.sizePolicy().hasHeightForWidth())
+        self.label_18.setSizePolicy(sizePolicy1)
+
+        self.formLayout_13.setWidget(0, QFormLayout.LabelRole, self.label_18)
+
+        self.title_pupil_FST_x = QDoubleSpinBox(self.groupBox_4)
+        self.title_pupil_FST_x.setObjectName(u"title_pupil_FST_x")
+        sizePolicy2.setHeightForWidth(self.title_pupil_FST_x.sizePolicy().hasHeightForWidth())
+        self.title_pupil_FST_x.setSizePolicy(sizePolicy2)
+        self.title_pupil_FST_x.setDecimals(1)
+        self.title_pupil_FST_x.setMaximum(220.000000000000000)
+
+        self.formLayout_13.setWidget(0, QFormLayout.FieldRole, self.title_pupil_FST_x)
+
+
+        self.horizontalLayout_20.addLayout(self.formLayout_13)
+
+        self.formLayout_14 = QFormLayout()
+        self.formLayout_14.setObjectName(u"formLayout_14")
+        self.label_19 = QLabel(self.groupBox_4)
+        self.label_19.setObjectName(u"label_19")
+        sizePolicy3.setHeightForWidth(self.label_19.sizePolicy().hasHeightForWidth())
+        self.label_19.setSizePolicy(sizePolicy3)
+
+        self.formLayout_14.setWidget(0, QFormLayout.LabelRole, self.label_19)
+
+        self.title_pupil_FST_y = QDoubleSpinBox(self.groupBox_4)
+        self.title_pupil_FST_y.setObjectName(u"title_pupil_FST_y")
+        sizePolicy2.setHeightForWidth(self.title_pupil_FST_y.sizePolicy().hasHeightForWidth())
+        self.title_pupil_FST_y.setSizePolicy(sizePolicy2)
+        self.title_pupil_FST_y.setDecimals(1)
+        self.title_pupil_FST_y.setMaximum(220.000000000000000)
+
+        self.formLayout_14.setWidget(0, QFormLayout.FieldRole, self.title_pupil_FST_y)
+
+
+        self.horizontalLayout_20.addLayout(self.formLayout_14)
+
+
+        self.formLayout_17.setLayout(4, QFormLayout.FieldRole, self.horizontalLayout_20)
+
+        self.label_23 = QLabel(self.groupBox_4)
+        self.label_23.setObjectName(u"label_23")
+
+        self.formLayout_17.setWidget(5, QFormLayout.LabelRole, self.label_23)
+
+        self.horizontalLayout_21 = QHBoxLayout()
+        self.horizontalLayout_21.setObjectName(u"horizontalLayout_21")
+        self.formLayout_15 = QFormLayout()
+        self.formLayout_15.setObjectName(u"formLayout_15")
+        self.label_21 = QLabel(self.groupBox_4)
+        self.label_21.setObjectName(u"label_21")
+        sizePolicy1.setHeightForWidth(self.label_21.sizePolicy().hasHeightForWidth())
+        self.label_21.setSizePolicy(sizePolicy1)
+
+        self.formLayout_15.setWidget(0, QFormLayout.LabelRole, self.label_21)
+
+        self.title_qrcode_x = QDoubleSpinBox(self.groupBox_4)
+        self.title_qrcode_x.setObjectName(u"title_qrcode_x")
+        sizePolicy2.setHeightForWidth(self.title_qrcode_x.sizePolicy().hasHeightForWidth())
+        self.title_qrcode_x.setSizePolicy(sizePolicy2)
+        self.title_qrcode_x.setDecimals(1)
+        self.title_qrcode_x.setMaximum(220.000000000000000)
+
+        self.formLayout_15.setWidget(0, QFormLayout.FieldRole, self.title_qrcode_x)
+
+
+        self.horizontalLayout_21.addLayout(self.formLayout_15)
+
+        self.formLayout_16 = QFormLayout()
+        self.formLayout_16.setObjectName(u"formLayout_16")
+        self.label_22 = QLabel(self.groupBox_4)
+        self.label_22.setObjectName(u"label_22")
+        sizePolicy3.setHeightForWidth(self.label_22.sizePolicy().hasHeightForWidth())
+        self.label_22.setSizePolicy(sizePolicy3)
+
+        self.formLayout_16.setWidget(0, QFormLayout.LabelRole, self.label_22)
+
+        self.title_qrcode_y = QDoubleSpinBox(self.groupBox_4)
+        self.title_qrcode_y.setObjectName(u"title_qrcode_y")
+        sizePolicy2.setHeightForWidth(self.title_qrcode_y.sizePolicy().hasHeightForWidth())
+        self.title_qrcode_y.setSizePolicy(sizePolicy2)
+        self.title_qrcode_y.setDecimals(1)
+        self.title_qrcode_y.setMaximum(220.000000000000000)
+
+        self.formLayout_16.setWidget(0, QFormLayout.FieldRole, self.title_qrcode_y)
+
+
+        self.horizontalLayout_21.addLayout(self.formLayout_16)
+
+
+        self.formLayout_17.setLayout(5, QFormLayout.FieldRole, self.horizontalLayout_21)
+
+
+        self.verticalLayout_11.addWidget(self.groupBox_4)
+
+        self.title_image = QCheckBox(self.groupBox_3)
+        self.title_image.setObjectName(u"title_image")
+
+        self.verticalLayout_11.addWidget(self.title_image)
+
+
+        self.verticalLayout_12.addWidget(self.groupBox_3)
+
+        self.verticalSpacer_8 = QSpacerItem(20, 207, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_12.addItem(self.verticalSpacer_8)
+
+        self.horizontalLayout_22 = QHBoxLayout()
+        self.horizontalLayout_22.setObjectName(u"horizontalLayout_22")
+        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_22.addItem(self.horizontalSpacer_5)
+
+        self.reset_title_settings = QPushButton(TitleLayout)
+        self.reset_title_settings.setObjectName(u"reset_title_settings")
+
+        self.horizontalLayout_22.addWidget(self.reset_title_settings)
+
+        self.save_title_settings = QPushButton(TitleLayout)
+        self.save_title_settings.setObjectName(u"save_title_settings")
+
+        self.horizontalLayout_22.addWidget(self.save_title_settings)
+
+
+        self.verticalLayout_12.addLayout(self.horizontalLayout_22)
+
+
+        self.retranslateUi(TitleLayout)
+
+        QMetaObject.connectSlotsByName(TitleLayout)
+    # setupUi
+
+    def retranslateUi(self, TitleLayout):
+        self.groupBox_3.setTitle(QCoreApplication.translate("TitleLayout", u"\u0422\u0438\u0442\u0443\u043b\u044c\u043d\u0438\u043a", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("TitleLayout", u"\u0420\u0430\u0437\u043c\u0435\u0449\u0435\u043d\u0438\u0435", None))
+        self.label_6.setText(QCoreApplication.translate("TitleLayout", u"\u0414\u0430\u0442\u0430 \u0432\u044b\u0434\u0430\u0447\u0438", None))
+        self.label_4.setText(QCoreApplication.translate("TitleLayout", u"X:", None))
+        self.label_5.setText(QCoreApplication.translate("TitleLayout", u"Y:", None))
+        self.label_11.setText(QCoreApplication.translate("TitleLayout", u"\u0413\u043e\u0434 \u0432\u044b\u0434\u0430\u0447\u0438", None))
+        self.label_9.setText(QCoreApplication.translate("TitleLayout", u"X:", None))
+        self.label_10.setText(QCoreApplication.translate("TitleLayout", u"Y:", None))
+        self.label_14.setText(QCoreApplication.translate("TitleLayout", u"\u041d\u0430\u0437\u0432\u0430\u043d\u0438\u0435 \u0448\u043a\u043e\u043b\u044b", None))
+        self.label_12.setText(QCoreApplication.translate("TitleLayout", u"X:", None))
+        self.label_13.setText(QCoreApplication.translate("TitleLayout", u"Y:", None))
+        self.label_17.setText(QCoreApplication.translate("TitleLayout", u"\u0424\u0418\u041e \u0440\u0443\u043a\u043e\u0432\u0430\u0434\u0438\u0442\u0435\u043b\u044f", None))
+        self.label_15.setText(QCoreApplication.translate("TitleLayout", u"X:", None))
+        self.label_16.setText(QCoreApplication.translate("TitleLayout", u"Y:", None))
+        self.label_20.setText(QCoreApplication.translate("TitleLayout", u"\u0424\u0418\u041e \u0443\u0447\u0435\u043d\u0438\u043a\u0430", None))
+        self.label_18.setText(QCoreApplication.translate("TitleLayout", u"X:", None))
+        self.label_19.setText(QCoreApplication.translate("TitleLayout", u"Y:", None))
+        self.label_23.setText(QCoreApplication.translate("TitleLayout", u"QR-\u043a\u043e\u0434", None))
+        self.label_21.setText(QCoreApplication.translate("TitleLayout", u"X:", None))
+        self.label_22.setText(QCoreApplication.translate("TitleLayout", u"Y:", None))
+        self.title_image.setText(QCoreApplication.translate("TitleLayout", u"\u041f\u0435\u0447\u0430\u0442\u0430\u0442\u044c \u0438\u0437\u043e\u0431\u0440\u0430\u0436\u0435\u043d\u0438\u0435 \u0442\u0438\u0442\u0443\u043b\u044c\u043d\u0438\u043a\u0430", None))
+        self.reset_title_settings.setText(QCoreApplication.translate("TitleLayout", u"\u0421\u0431\u0440\u043e\u0441\u0438\u0442\u044c", None))
+        self.save_title_settings.setText(QCoreApplication.translate("TitleLayout", u"\u0421\u043e\u0445\u0440\u0430\u043d\u0438\u0442\u044c", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,142 @@
+from __future__ import annotations
+from PySide6.QtCore import QObject, QRunnable, Signal
+from copy import copy
+from datacls import PupilsTable, Ratings
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from datacls import DiplomaParametrs, DiplomaTitleLayoutParametrs, PupilInformation
+    from storage import SessionFile
+
+class LoadPupilsSignals(QObject):
+    subjects = Signal(tuple)
+    batch = Signal(object)
+    progress = Signal(int, int)
+    finished = Signal(bool)
+    error = Signal(str)
+
+class LoadPupilsWorker(QRunnable):
+    batch_size = 500
+    parsed_cache_directory = "cache/workbooks"
+
+    def __init__(self, file: str) -> None:
+        super().__init__()
+        self.file = file
+        self.cancelled = False
+        self.signals = LoadPupilsSignals()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def run(self) -> None:
+        from file_parsing import open_parser
+        from storage import ParsedCache
+
+        cache: ParsedCache | None = None
+        try:
+            cache = ParsedCache(self.parsed_cache_directory)
+            cached = cache.get(self.file)
+        except OSError:
+            cached = None
+        if cached is not None:
+            self.signals.subjects.emit(cached.subjects)
+            self.signals.batch.emit(cached)
+            self.signals.progress.emit(len(cached.pupils), len(cached.pupils))
+            self.signals.finished.emit(True)
+            return
+
+        try:
+            parser = open_parser(self.file)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+
+        parsed = None
+        try:
+            total = parser.get_rows_count()
+            loaded = 0
+            for i, table in enumerate(parser.iter_tables(self.batch_size)):
+                if self.cancelled:
+                    break
+                if i == 0:
+                    self.signals.subjects.emit(table.subjects)
+                    parsed = PupilsTable([], Ratings(table.subjects))
+                if table.pupils:
+                    loaded += len(table.pupils)
+                    parsed.extend(PupilsTable([copy(p) for p in table.pupils], table.ratings)) # type: ignore
+                    self.signals.batch.emit(table)
+                    self.signals.progress.emit(loaded, max(total, loaded))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        finally:
+            parser.close()
+
+        if not self.cancelled and parsed is not None and cache is not None:
+            try:
+                cache.put(self.file, parsed)
+            except OSError:
+                pass
+        self.signals.finished.emit(not self.cancelled)
+
+class LoadSessionWorker(QRunnable):
+    def __init__(self, session: SessionFile) -> None:
+        super().__init__()
+        self.session = session
+        self.cancelled = False
+        self.signals = LoadPupilsSignals()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def run(self) -> None:
+        try:
+            table = self.session.load()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        if table is not None and not self.cancelled:
+            self.signals.subjects.emit(table.subjects)
+            self.signals.batch.emit(table)
+            self.signals.progress.emit(len(table.pupils), len(table.pupils))
+        self.signals.finished.emit(not self.cancelled)
+
+class RenderDiplomasSignals(QObject):
+    progress = Signal(int, int)
+    finished = Signal(str)
+    cancelled = Signal()
+    error = Signal(str)
+
+class RenderDiplomasWorker(QRunnable):
+    qrcode_cache_directory = "cache/qrcodes"
+
+    def __init__(self, diploma_params: DiplomaParametrs, title_params: DiplomaTitleLayoutParametrs, pupils: list[PupilInformation], file: str = "tests/test.pdf", print_supplement: bool = False) -> None:
+        super().__init__()
+        self.diploma_params = diploma_params
+        self.title_params = title_params
+        self.pupils = pupils
+        self.file = file
+        self.print_supplement = print_supplement
+        self.cancelled = False
+        self.signals = RenderDiplomasSignals()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def page_rendered(self, count: int) -> bool:
+        self.signals.progress.emit(count, len(self.pupils))
+        return not self.cancelled
+
+    def run(self) -> None:
+        try:
+            from diploma import DiplomaLayout, QRCodeCache
+
+            pdf = DiplomaLayout(self.diploma_params, self.title_params, qrcode_cache=QRCodeCache(self.qrcode_cache_directory), print_supplement=self.print_supplement)
+            if not pdf.generate_title_lists(self.pupils, progress=self.page_rendered):
+                self.signals.cancelled.emit()
+                return
+            pdf.save_file(self.file)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(self.file)